@@ -23,13 +23,16 @@ val logbackVersion = project.findProperty("logback.version") as String? ?: "1.5.
 dependencies {
     implementation("io.modelcontextprotocol:kotlin-sdk:${mcpVersion}")
 
+    implementation("io.ktor:ktor-client-java:${ktorVersion}")
     implementation("io.ktor:ktor-client-content-negotiation:${ktorVersion}")
+    implementation("io.ktor:ktor-client-encoding:${ktorVersion}")
     implementation("io.ktor:ktor-serialization-kotlinx-json:${ktorVersion}")
     implementation("io.ktor:ktor-client-logging:${ktorVersion}")
 
     implementation("ch.qos.logback:logback-classic:${logbackVersion}")
 
     testImplementation(kotlin("test"))
+    testImplementation("org.junit.jupiter:junit-jupiter-params:5.10.1")
     testImplementation("org.jetbrains.kotlinx:kotlinx-coroutines-test:1.10.1")
     testImplementation("io.ktor:ktor-client-mock:${ktorVersion}")
     testImplementation("io.mockk:mockk:1.13.10")
@@ -38,6 +41,15 @@ dependencies {
 tasks.test {
     useJUnitPlatform()
 
+    // 테스트 클래스끼리는 서로 상태를 공유하지 않으므로 클래스 단위로 병렬 실행합니다.
+    // 같은 클래스의 테스트 메서드는 인스턴스 상태(PER_CLASS)를 공유할 수 있어 순차 실행을 유지합니다.
+    systemProperty("junit.jupiter.execution.parallel.enabled", "true")
+    systemProperty("junit.jupiter.execution.parallel.mode.default", "same_thread")
+    systemProperty("junit.jupiter.execution.parallel.mode.classes.default", "concurrent")
+
+    // 단위 테스트는 compact JSON 출력을 기준으로 검증하므로, 개발자 환경의 DOORAY_MCP_PRETTY 설정과 무관하게 고정합니다.
+    environment("DOORAY_MCP_PRETTY", "false")
+
     // GitHub Actions 환경에서는 통합 테스트 제외
     if (System.getenv("CI") == "true") {
         exclude("**/*IntegrationTest*")
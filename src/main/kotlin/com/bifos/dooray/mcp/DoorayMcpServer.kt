@@ -5,6 +5,7 @@ import com.bifos.dooray.mcp.constants.EnvVariableConst.DOORAY_API_KEY
 import com.bifos.dooray.mcp.constants.EnvVariableConst.DOORAY_BASE_URL
 import com.bifos.dooray.mcp.constants.VersionConst
 import com.bifos.dooray.mcp.tools.*
+import com.bifos.dooray.mcp.utils.TtlCache
 import io.ktor.utils.io.streams.*
 import io.modelcontextprotocol.kotlin.sdk.*
 import io.modelcontextprotocol.kotlin.sdk.server.Server
@@ -15,6 +16,7 @@ import kotlinx.coroutines.runBlocking
 import kotlinx.io.asSink
 import kotlinx.io.buffered
 import org.slf4j.LoggerFactory
+import kotlin.time.Duration.Companion.seconds
 
 class DoorayMcpServer {
 
@@ -26,6 +28,7 @@ class DoorayMcpServer {
         val env = getEnv()
 
         log.info("DOORAY_API_KEY, DOORAY_BASE_URL found, initializing HTTP client...")
+        // 모든 도구 핸들러가 이 인스턴스(와 연결 풀)를 공유합니다
         val doorayHttpClient =
             DoorayHttpClient(
                 baseUrl = env[DOORAY_BASE_URL]!!,
@@ -64,6 +67,7 @@ class DoorayMcpServer {
             val done = Job()
             server.onClose {
                 log.info("MCP server closing...")
+                doorayHttpClient.close()
                 done.complete()
             }
             done.join()
@@ -99,102 +103,137 @@ class DoorayMcpServer {
             toolCount++
         }
 
+        // 업무/댓글 조회 결과는 readCache 에 30초간 캐싱하고, 업무/댓글을 변경하면 캐시를 비웁니다.
+        // 위키는 자주 바뀌지 않으므로 wikiCache 에 60초간 캐싱하고, 위키 페이지를 생성/수정하면 캐시를 비웁니다.
+        val readCache = createReadCache()
+        val wikiCache = createReadCache(ttl = 60.seconds)
+
+        fun addCachedGetTool(
+            tool: Tool,
+            handler: suspend (CallToolRequest) -> CallToolResult,
+            cache: TtlCache<String, CallToolResult> = readCache
+        ) {
+            addTool(tool, cachedGet(tool.name, cache, handler))
+        }
+
+        fun addMutatingTool(
+            tool: Tool,
+            handler: suspend (CallToolRequest) -> CallToolResult,
+            cache: TtlCache<String, CallToolResult> = readCache
+        ) {
+            addTool(tool, invalidatesCache(cache, handler))
+        }
+
         // 1. 위키 프로젝트 목록 조회
-        addTool(getWikisTool(), getWikisHandler(doorayHttpClient))
+        addCachedGetTool(getWikisTool(), getWikisHandler(doorayHttpClient), wikiCache)
 
         // 2. 위키 페이지 목록 조회
-        addTool(getWikiPagesTool(), getWikiPagesHandler(doorayHttpClient))
+        addCachedGetTool(getWikiPagesTool(), getWikiPagesHandler(doorayHttpClient), wikiCache)
 
         // 3. 위키 페이지 상세 조회
-        addTool(getWikiPageTool(), getWikiPageHandler(doorayHttpClient))
+        addCachedGetTool(getWikiPageTool(), getWikiPageHandler(doorayHttpClient), wikiCache)
 
         // 4. 위키 페이지 생성
-        addTool(createWikiPageTool(), createWikiPageHandler(doorayHttpClient))
+        addMutatingTool(createWikiPageTool(), createWikiPageHandler(doorayHttpClient), wikiCache)
 
         // 5. 위키 페이지 수정
-        addTool(updateWikiPageTool(), updateWikiPageHandler(doorayHttpClient))
+        addMutatingTool(updateWikiPageTool(), updateWikiPageHandler(doorayHttpClient), wikiCache)
 
         // ============ 프로젝트 업무 관련 도구들 ============
 
         // 6. 프로젝트 업무 목록 조회
-        addTool(getProjectPostsTool(), getProjectPostsHandler(doorayHttpClient))
+        addCachedGetTool(getProjectPostsTool(), getProjectPostsHandler(doorayHttpClient))
 
         // 7. 프로젝트 업무 상세 조회
-        addTool(getProjectPostTool(), getProjectPostHandler(doorayHttpClient))
+        addCachedGetTool(getProjectPostTool(), getProjectPostHandler(doorayHttpClient))
 
-        // 8. 프로젝트 업무 생성
-        addTool(createProjectPostTool(), createProjectPostHandler(doorayHttpClient))
+        // 8. 프로젝트 업무 여러 건 동시 조회
+        // 일부 업무만 실패한 결과도 isError 가 아니므로, 일시적인 실패가 캐싱되지 않도록 캐시 없이 등록합니다.
+        addTool(getProjectPostsBatchTool(), getProjectPostsBatchHandler(doorayHttpClient))
 
-        // 9. 프로젝트 업무 상태 변경
-        addTool(
+        // 9. 프로젝트 업무 생성
+        addMutatingTool(createProjectPostTool(), createProjectPostHandler(doorayHttpClient))
+
+        // 10. 프로젝트 업무 상태 변경
+        addMutatingTool(
             setProjectPostWorkflowTool(),
             setProjectPostWorkflowHandler(doorayHttpClient)
         )
 
-        // 10. 프로젝트 업무 완료 처리
-        addTool(setProjectPostDoneTool(), setProjectPostDoneHandler(doorayHttpClient))
+        // 11. 프로젝트 업무 완료 처리
+        addMutatingTool(setProjectPostDoneTool(), setProjectPostDoneHandler(doorayHttpClient))
+
+        // 12. 프로젝트 목록 조회 (캐시 초기화 도구와 같은 캐시를 공유)
+        val projectsCache = createProjectsCache()
+        addCachedGetTool(getProjectsTool(), getProjectsHandler(doorayHttpClient), projectsCache)
 
-        // 11. 프로젝트 목록 조회
-        addTool(getProjectsTool(), getProjectsHandler(doorayHttpClient))
+        // 13. 프로젝트 목록 캐시 초기화
+        addTool(clearProjectsCacheTool(), clearProjectsCacheHandler(projectsCache))
 
-        // 12. 프로젝트 업무 수정
-        addTool(updateProjectPostTool(), updateProjectPostHandler(doorayHttpClient))
+        // 14. 프로젝트 업무 수정
+        addMutatingTool(updateProjectPostTool(), updateProjectPostHandler(doorayHttpClient))
 
         // ============ 업무 댓글 관련 도구들 ============
 
-        // 13. 업무 댓글 생성
-        addTool(createPostCommentTool(), createPostCommentHandler(doorayHttpClient))
+        // 15. 업무 댓글 생성
+        addMutatingTool(createPostCommentTool(), createPostCommentHandler(doorayHttpClient))
 
-        // 14. 업무 댓글 목록 조회
-        addTool(getPostCommentsTool(), getPostCommentsHandler(doorayHttpClient))
+        // 16. 업무 댓글 목록 조회
+        addCachedGetTool(getPostCommentsTool(), getPostCommentsHandler(doorayHttpClient))
 
-        // 15. 업무 댓글 수정
-        addTool(updatePostCommentTool(), updatePostCommentHandler(doorayHttpClient))
+        // 17. 업무 댓글 수정
+        addMutatingTool(updatePostCommentTool(), updatePostCommentHandler(doorayHttpClient))
 
-        // 16. 업무 댓글 삭제
-        addTool(deletePostCommentTool(), deletePostCommentHandler(doorayHttpClient))
+        // 18. 업무 댓글 삭제
+        addMutatingTool(deletePostCommentTool(), deletePostCommentHandler(doorayHttpClient))
+
+        // 19. 업무 상세 + 댓글 목록 동시 조회
+        addCachedGetTool(
+            getProjectPostWithCommentsTool(),
+            getProjectPostWithCommentsHandler(doorayHttpClient)
+        )
 
         // ============ 메신저 관련 도구들 ============
 
-        // 17. 멤버 검색
+        // 20. 멤버 검색
         addTool(searchMembersTool(), searchMembersHandler(doorayHttpClient))
 
-        // 18. 다이렉트 메시지 전송
+        // 21. 다이렉트 메시지 전송
         addTool(sendDirectMessageTool(), sendDirectMessageHandler(doorayHttpClient))
 
-        // 19. 채널 목록 조회
+        // 22. 채널 목록 조회
         addTool(getChannelsTool(), getChannelsHandler(doorayHttpClient))
 
-        // 20. 간단한 채널 목록 조회 (검색용)
+        // 23. 간단한 채널 목록 조회 (검색용)
         addTool(getSimpleChannelsTool(), getSimpleChannelsHandler(doorayHttpClient))
 
-        // 21. 특정 채널 상세 조회
+        // 24. 특정 채널 상세 조회
         addTool(getChannelTool(), getChannelHandler(doorayHttpClient))
 
         // ⚠️ 채널 로그 조회는 Dooray API에서 지원하지 않음 (보안상 제한)
-        // 22. 채널 메시지 전송
+        // 25. 채널 메시지 전송
         addTool(sendChannelMessageTool(), sendChannelMessageHandler(doorayHttpClient))
 
-        // 23. 채널 생성
+        // 26. 채널 생성
         addTool(createChannelTool(), createChannelHandler(doorayHttpClient))
 
         // ============ 캘린더 관련 도구들 ============
 
-        // 24. 캘린더 목록 조회
+        // 27. 캘린더 목록 조회
         addTool(getCalendarsTool(), getCalendarsHandler(doorayHttpClient))
 
-        // 25. 캘린더 상세 조회
+        // 28. 캘린더 상세 조회
         addTool(getCalendarDetailTool(), getCalendarDetailHandler(doorayHttpClient))
 
-        // 26. 캘린더 일정 조회 (기간별)
+        // 29. 캘린더 일정 조회 (기간별)
         addTool(getCalendarEventsTool(), getCalendarEventsHandler(doorayHttpClient))
 
-        // 27. 캘린더 일정 상세 조회
+        // 30. 캘린더 일정 상세 조회
         addTool(getCalendarEventDetailTool(), getCalendarEventDetailHandler(doorayHttpClient))
 
-        // 28. 캘린더 일정 등록
+        // 31. 캘린더 일정 등록
         addTool(createCalendarEventTool(), createCalendarEventHandler(doorayHttpClient))
 
-        log.info("Successfully added $toolCount tools to MCP server")
+        log.info("Successfully added {} tools to MCP server", toolCount)
     }
 }
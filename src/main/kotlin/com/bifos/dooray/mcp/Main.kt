@@ -8,7 +8,7 @@ fun main() {
     configureSystemLogging()
 
     val logger = LoggerFactory.getLogger("com.bifos.dooray.mcp.Main")
-    logger.info("🚀 Dooray MCP Server v${VersionConst.VERSION} starting...")
+    logger.info("🚀 Dooray MCP Server v{} starting...", VersionConst.VERSION)
 
     DoorayMcpServer().initServer()
 }
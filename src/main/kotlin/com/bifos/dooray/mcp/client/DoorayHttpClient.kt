@@ -4,20 +4,58 @@ import com.bifos.dooray.mcp.exception.CustomException
 import com.bifos.dooray.mcp.types.*
 import io.ktor.client.*
 import io.ktor.client.call.*
+import io.ktor.client.engine.java.*
 import io.ktor.client.plugins.*
+import io.ktor.client.plugins.api.*
+import io.ktor.client.plugins.compression.*
 import io.ktor.client.plugins.contentnegotiation.*
 import io.ktor.client.plugins.logging.*
 import io.ktor.client.request.*
 import io.ktor.client.statement.*
 import io.ktor.http.*
 import io.ktor.serialization.kotlinx.json.*
+import java.io.Closeable
+import kotlinx.coroutines.sync.Semaphore
+import kotlinx.coroutines.sync.withPermit
 import kotlinx.serialization.json.Json
 import org.slf4j.LoggerFactory
 
+/** 두레이 API 서버 연결 제한 시간 */
+private const val CONNECT_TIMEOUT_MILLIS = 10_000L
+
+/** 요청 하나(연결 + 응답 수신)의 최대 대기 시간 */
+private const val REQUEST_TIMEOUT_MILLIS = 30_000L
+
+/** 연결 풀에 유지할 최대 연결 수 - 모든 도구 호출이 같은 두레이 호스트로 가므로 호스트당 제한과 같게 둡니다. */
+private const val MAX_CONNECTIONS = 20
+
+/** 유휴 keep-alive 연결 유지 시간 (초) */
+private const val KEEP_ALIVE_TIMEOUT_SECONDS = 30
+
+/**
+ * 동시에 두레이로 보내는 요청 수를 MAX_CONNECTIONS 로 제한합니다.
+ * 서버가 HTTP/2 를 제공하지 않아 HTTP/1.1 로 전환되면 JDK 클라이언트는 호스트당 연결 수 제한이 없으므로,
+ * 배치 도구나 여러 세션의 동시 호출이 소켓을 무한정 열지 않도록 요청 단위로 막습니다.
+ */
+private val MaxConcurrentRequests =
+        createClientPlugin("MaxConcurrentRequests") {
+            val permits = Semaphore(MAX_CONNECTIONS)
+            on(Send) { request -> permits.withPermit { proceed(request) } }
+        }
+
+/** 채널 updatedAt 끝의 KST 오프셋 (LocalDateTime 파싱 전에 제거) */
+private val KST_OFFSET_SUFFIX = Regex("\\+09:00$")
+
+/**
+ * 두레이 API HTTP 클라이언트입니다.
+ * 서버 시작 시 하나만 생성하여 모든 도구 핸들러가 공유합니다. HTTP/2 로 연결하여 동시에 실행되는 도구 호출들을
+ * 하나의 TLS 연결에서 다중화하며, 서버가 HTTP/2 를 지원하지 않으면 keep-alive HTTP/1.1 로 자동 전환됩니다.
+ */
 class DoorayHttpClient(private val baseUrl: String, private val doorayApiKey: String) :
-        DoorayClient {
+        DoorayClient, Closeable {
 
     private val log = LoggerFactory.getLogger(DoorayHttpClient::class.java)
+    private val jsonFormat = Json { ignoreUnknownKeys = true }
     private val httpClient: HttpClient
 
     init {
@@ -25,44 +63,84 @@ class DoorayHttpClient(private val baseUrl: String, private val doorayApiKey: St
     }
 
     private fun initHttpClient(): HttpClient {
-        return HttpClient {
+        configureJdkConnectionPool()
+        return HttpClient(Java) {
+            engine {
+                protocolVersion = java.net.http.HttpClient.Version.HTTP_2
+            }
+
+            install(MaxConcurrentRequests)
+
             defaultRequest {
                 url(baseUrl)
                 header("Authorization", "dooray-api $doorayApiKey")
                 contentType(ContentType.Application.Json)
             }
 
-            // install content negotiation plugin for JSON serialization/deserialization
-            install(ContentNegotiation) {
-                json(
-                        Json {
-                            ignoreUnknownKeys = true
-                            prettyPrint = true
-                        }
-                )
+            // 응답이 없는 연결이 풀을 점유한 채 도구 호출을 무기한 붙잡지 않도록 시간 제한을 둡니다
+            install(HttpTimeout) {
+                connectTimeoutMillis = CONNECT_TIMEOUT_MILLIS
+                requestTimeoutMillis = REQUEST_TIMEOUT_MILLIS
+            }
+
+            // 목록 API 응답은 항목마다 같은 키가 반복되는 큰 JSON 이므로 압축 전송을 요청합니다 (Accept-Encoding)
+            install(ContentEncoding) {
+                gzip()
+                deflate()
             }
 
+            // install content negotiation plugin for JSON serialization/deserialization
+            // 요청 본문은 사람이 읽지 않으므로 들여쓰기 없이 compact 하게 직렬화합니다
+            install(ContentNegotiation) { json(jsonFormat) }
+
             // HTTP 요청/응답 로깅 활성화 (SLF4J 사용, stdout 오염 방지)
-            install(Logging) {
-                logger =
-                        object : Logger {
-                            override fun log(message: String) {
-                                log.debug("HTTP: $message")
+            // 로그가 실제로 출력되지 않는 경우(NONE 또는 debug 비활성)에는 플러그인을 설치하지 않아
+            // 요청마다 헤더/본문 로그 메시지를 만드는 비용을 없앱니다.
+            val httpLogLevel = httpLogLevel()
+            if (httpLogLevel != LogLevel.NONE && log.isDebugEnabled) {
+                install(Logging) {
+                    logger =
+                            object : Logger {
+                                override fun log(message: String) {
+                                    log.debug("HTTP: {}", message)
+                                }
                             }
-                        }
-                // 환경변수로 로깅 레벨 제어 (기본: NONE, 디버깅시: INFO)
-                level =
-                        when (System.getenv("DOORAY_HTTP_LOG_LEVEL")?.uppercase()) {
-                            "ALL" -> LogLevel.ALL
-                            "HEADERS" -> LogLevel.HEADERS
-                            "BODY" -> LogLevel.BODY
-                            "INFO" -> LogLevel.INFO
-                            else -> LogLevel.NONE // 기본값: 로깅 비활성화
-                        }
+                    level = httpLogLevel
+                }
             }
         }
     }
 
+    /** 환경변수로 로깅 레벨 제어 (기본: NONE, 디버깅시: INFO) */
+    private fun httpLogLevel(): LogLevel {
+        return when (System.getenv("DOORAY_HTTP_LOG_LEVEL")?.uppercase()) {
+            "ALL" -> LogLevel.ALL
+            "HEADERS" -> LogLevel.HEADERS
+            "BODY" -> LogLevel.BODY
+            "INFO" -> LogLevel.INFO
+            else -> LogLevel.NONE // 기본값: 로깅 비활성화
+        }
+    }
+
+    /**
+     * java.net.http 연결 풀의 크기와 keep-alive 시간을 지정합니다.
+     * JDK 클라이언트는 이 값을 엔진 설정이 아닌 시스템 프로퍼티로만 받으며, 첫 클라이언트 생성 시 한 번 읽으므로 그 전에 설정합니다.
+     * 사용자가 -D 옵션으로 직접 지정한 값은 덮어쓰지 않습니다.
+     */
+    private fun configureJdkConnectionPool() {
+        if (System.getProperty("jdk.httpclient.connectionPoolSize") == null) {
+            System.setProperty("jdk.httpclient.connectionPoolSize", MAX_CONNECTIONS.toString())
+        }
+        if (System.getProperty("jdk.httpclient.keepalive.timeout") == null) {
+            System.setProperty("jdk.httpclient.keepalive.timeout", KEEP_ALIVE_TIMEOUT_SECONDS.toString())
+        }
+    }
+
+    /** 연결 풀과 엔진 리소스를 해제합니다. 서버 종료 시 호출합니다. */
+    override fun close() {
+        httpClient.close()
+    }
+
     /**
      * API 호출을 공통 템플릿으로 처리합니다.
      * @param operation API 요청 설명 (로깅용)
@@ -77,9 +155,9 @@ class DoorayHttpClient(private val baseUrl: String, private val doorayApiKey: St
             crossinline apiCall: suspend () -> HttpResponse
     ): T {
         try {
-            log.info("🔗 API 요청: $operation")
+            log.info("🔗 API 요청: {}", operation)
             val response = apiCall()
-            log.info("📡 응답 수신: ${response.status} ${response.status.description}")
+            log.info("📡 응답 수신: {}", response.status)
 
             return when (response.status) {
                 expectedStatusCode -> {
@@ -102,24 +180,27 @@ class DoorayHttpClient(private val baseUrl: String, private val doorayApiKey: St
     private suspend fun handleErrorResponse(response: HttpResponse): Nothing {
         val responseBody = response.bodyAsText()
         log.error("❌ API 오류 응답:")
-        log.error("  상태 코드: ${response.status.value} ${response.status.description}")
-        log.error("  응답 본문: $responseBody")
+        log.error("  상태 코드: {}", response.status)
+        log.error("  응답 본문: {}", responseBody)
 
-        try {
-            val errorResponse = response.body<DoorayErrorResponse>()
-            val errorMessage = "API 호출 실패: ${errorResponse.header.resultMessage}"
-            throw CustomException(errorMessage, response.status.value)
-        } catch (parseException: Exception) {
-            val errorMessage = "API 응답 파싱 실패 (${response.status.value}): $responseBody"
-            throw CustomException(errorMessage, response.status.value, parseException)
-        }
+        // 이미 읽어 둔 본문 문자열을 그대로 디코딩합니다 (응답 본문을 다시 읽고 파싱하지 않음)
+        val errorResponse =
+                try {
+                    jsonFormat.decodeFromString<DoorayErrorResponse>(responseBody)
+                } catch (parseException: IllegalArgumentException) {
+                    val errorMessage = "API 응답 파싱 실패 (${response.status.value}): $responseBody"
+                    throw CustomException(errorMessage, response.status.value, parseException)
+                }
+
+        val errorMessage = "API 호출 실패: ${errorResponse.header.resultMessage}"
+        throw CustomException(errorMessage, response.status.value)
     }
 
     /** 일반 예외를 공통으로 처리합니다. */
     private fun handleGenericException(e: Exception): Nothing {
         log.error("❌ 네트워크 또는 기타 오류:")
-        log.error("  타입: ${e::class.simpleName}")
-        log.error("  메시지: ${e.message}")
+        log.error("  타입: {}", e::class.simpleName)
+        log.error("  메시지: {}", e.message)
         log.error("스택 트레이스:", e)
 
         val errorMessage = "API 호출 중 오류 발생: ${e.message}"
@@ -134,9 +215,9 @@ class DoorayHttpClient(private val baseUrl: String, private val doorayApiKey: St
             apiCall: suspend () -> HttpResponse
     ): DoorayApiUnitResponse {
         try {
-            log.info("🔗 API 요청: $operation")
+            log.info("🔗 API 요청: {}", operation)
             val response = apiCall()
-            log.info("📡 응답 수신: ${response.status} ${response.status.description}")
+            log.info("📡 응답 수신: {}", response.status)
 
             return when (response.status) {
                 expectedStatusCode -> {
@@ -145,7 +226,7 @@ class DoorayHttpClient(private val baseUrl: String, private val doorayApiKey: St
                     if (jsonResponse.header.isSuccessful) {
                         log.info(successMessage)
                     } else {
-                        log.warn("⚠️ API 응답 에러: ${jsonResponse.header.resultMessage}")
+                        log.warn("⚠️ API 응답 에러: {}", jsonResponse.header.resultMessage)
                     }
                     jsonResponse
                 }
@@ -514,15 +595,20 @@ class DoorayHttpClient(private val baseUrl: String, private val doorayApiKey: St
             val filteredChannels = response.result.filter { channel ->
                 try {
                     val updatedAt = java.time.LocalDateTime.parse(
-                        channel.updatedAt?.replace(Regex("\\+09:00$"), "")?.split(".")?.get(0) ?: return@filter false
+                        channel.updatedAt?.replace(KST_OFFSET_SUFFIX, "")?.split(".")?.get(0) ?: return@filter false
                     )
                     updatedAt.isAfter(cutoffDate)
                 } catch (e: Exception) {
-                    log.warn("날짜 파싱 실패 for channel ${channel.id}: ${channel.updatedAt}")
+                    log.warn("날짜 파싱 실패 for channel {}: {}", channel.id, channel.updatedAt)
                     false
                 }
             }
-            log.info("🔍 최근 ${recentMonths}개월 필터링: ${response.result.size}개 → ${filteredChannels.size}개 채널")
+            log.info(
+                    "🔍 최근 {}개월 필터링: {}개 → {}개 채널",
+                    recentMonths,
+                    response.result.size,
+                    filteredChannels.size
+            )
             ChannelListResponse(
                 header = response.header,
                 result = filteredChannels,
@@ -552,7 +638,7 @@ class DoorayHttpClient(private val baseUrl: String, private val doorayApiKey: St
             )
         }
         
-        log.info("✂️ 채널 정보 간소화: 상세 정보 제거, ${response.result.size}개 채널 → 간단 정보만")
+        log.info("✂️ 채널 정보 간소화: 상세 정보 제거, {}개 채널 → 간단 정보만", response.result.size)
         
         return SimpleChannelListResponse(
             header = response.header,
@@ -568,17 +654,17 @@ class DoorayHttpClient(private val baseUrl: String, private val doorayApiKey: St
             if (response.header.isSuccessful) {
                 val channel = response.result.find { it.id == channelId }
                 if (channel != null) {
-                    log.info("✅ 채널 정보 조회 성공: ${channel.title} (ID: $channelId)")
+                    log.info("✅ 채널 정보 조회 성공: {} (ID: {})", channel.title, channelId)
                 } else {
-                    log.warn("⚠️ 채널을 찾을 수 없습니다: ID=$channelId")
+                    log.warn("⚠️ 채널을 찾을 수 없습니다: ID={}", channelId)
                 }
                 channel
             } else {
-                log.error("❌ 채널 목록 조회 실패: ${response.header.resultMessage}")
+                log.error("❌ 채널 목록 조회 실패: {}", response.header.resultMessage)
                 null
             }
         } catch (e: Exception) {
-            log.error("❌ 채널 조회 중 오류 발생: ${e.message}")
+            log.error("❌ 채널 조회 중 오류 발생: {}", e.message)
             null
         }
     }
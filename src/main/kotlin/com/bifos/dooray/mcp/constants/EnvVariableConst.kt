@@ -4,6 +4,7 @@ object EnvVariableConst {
 
     val DOORAY_BASE_URL = "DOORAY_BASE_URL"
     val DOORAY_API_KEY = "DOORAY_API_KEY"
+    val DOORAY_MCP_PRETTY = "DOORAY_MCP_PRETTY"
     val DOORAY_TEST_PROJECT_ID = "DOORAY_TEST_PROJECT_ID"
     val DOORAY_TEST_WIKI_ID = "DOORAY_TEST_WIKI_ID"
 }
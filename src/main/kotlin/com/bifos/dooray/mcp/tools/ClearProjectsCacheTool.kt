@@ -0,0 +1,39 @@
+package com.bifos.dooray.mcp.tools
+
+import com.bifos.dooray.mcp.utils.TtlCache
+import io.modelcontextprotocol.kotlin.sdk.CallToolRequest
+import io.modelcontextprotocol.kotlin.sdk.CallToolResult
+import io.modelcontextprotocol.kotlin.sdk.Tool
+import kotlinx.serialization.json.buildJsonObject
+import kotlinx.serialization.json.put
+
+fun clearProjectsCacheTool(): Tool {
+    return Tool(
+        name = "dooray_project_clear_projects_cache",
+        description =
+            "dooray_project_list_projects 의 캐시(60초)를 비웁니다. 방금 생성/변경된 프로젝트가 목록에 보이지 않을 때 사용하세요.",
+        inputSchema =
+            Tool.Input(
+                properties =
+                    buildJsonObject {
+                        // 캐시 초기화는 별도 파라미터가 필요하지 않음
+                    }
+            ),
+        outputSchema = null,
+        annotations = null
+    )
+}
+
+fun clearProjectsCacheHandler(
+    projectsCache: TtlCache<String, CallToolResult>
+): suspend (CallToolRequest) -> CallToolResult {
+    return runTool {
+        val clearedEntries = projectsCache.size
+        projectsCache.clear()
+
+        toolSuccess(
+            data = buildJsonObject { put("clearedEntries", clearedEntries) },
+            message = "🧹 프로젝트 목록 캐시를 비웠습니다 (${clearedEntries}개 항목 제거)"
+        )
+    }
+}
@@ -66,37 +66,25 @@ fun createChannelHandler(doorayClient: DoorayClient): suspend (CallToolRequest)
 
             when {
                 type == null -> {
-                    val errorResponse = ToolException(
+                    ToolException(
                         type = ToolException.PARAMETER_MISSING,
                         message = "type 파라미터가 필요합니다. (\"private\" 또는 \"direct\")",
                         code = "MISSING_TYPE"
-                    ).toErrorResponse()
-
-                    CallToolResult(
-                        content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-                    )
+                    ).toCallToolResult()
                 }
                 title == null -> {
-                    val errorResponse = ToolException(
+                    ToolException(
                         type = ToolException.PARAMETER_MISSING,
                         message = "title 파라미터가 필요합니다.",
                         code = "MISSING_TITLE"
-                    ).toErrorResponse()
-
-                    CallToolResult(
-                        content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-                    )
+                    ).toCallToolResult()
                 }
                 type !in listOf("private", "direct") -> {
-                    val errorResponse = ToolException(
+                    ToolException(
                         type = ToolException.VALIDATION_ERROR,
                         message = "type은 \"private\" 또는 \"direct\"여야 합니다.",
                         code = "INVALID_TYPE"
-                    ).toErrorResponse()
-
-                    CallToolResult(
-                        content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-                    )
+                    ).toCallToolResult()
                 }
                 else -> {
                     val createChannelRequest = CreateChannelRequest(
@@ -124,33 +112,22 @@ fun createChannelHandler(doorayClient: DoorayClient): suspend (CallToolRequest)
                             content = listOf(TextContent(JsonUtils.toJsonString(successResponse)))
                         )
                     } else {
-                        val errorResponse = ToolException(
+                        ToolException(
                             type = ToolException.API_ERROR,
                             message = "채널 생성 실패: ${response.header.resultMessage}",
                             code = "CREATE_CHANNEL_FAILED"
-                        ).toErrorResponse()
-                        
-                        CallToolResult(
-                            content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-                        )
+                        ).toCallToolResult()
                     }
                 }
             }
         } catch (e: ToolException) {
-            val errorResponse = e.toErrorResponse()
-            CallToolResult(
-                content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-            )
+            e.toCallToolResult()
         } catch (e: Exception) {
-            val errorResponse = ToolException(
+            ToolException(
                 type = ToolException.INTERNAL_ERROR,
                 message = "채널 생성 중 오류가 발생했습니다: ${e.message}",
                 code = "CREATE_CHANNEL_ERROR"
-            ).toErrorResponse()
-            
-            CallToolResult(
-                content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-            )
+            ).toCallToolResult()
         }
     }
 }
\ No newline at end of file
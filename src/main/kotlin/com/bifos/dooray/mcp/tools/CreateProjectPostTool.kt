@@ -1,12 +1,10 @@
 package com.bifos.dooray.mcp.tools
 
 import com.bifos.dooray.mcp.client.DoorayClient
-import com.bifos.dooray.mcp.exception.ToolException
 import com.bifos.dooray.mcp.types.*
 import com.bifos.dooray.mcp.utils.JsonUtils
 import io.modelcontextprotocol.kotlin.sdk.CallToolRequest
 import io.modelcontextprotocol.kotlin.sdk.CallToolResult
-import io.modelcontextprotocol.kotlin.sdk.TextContent
 import io.modelcontextprotocol.kotlin.sdk.Tool
 import kotlinx.serialization.json.buildJsonObject
 import kotlinx.serialization.json.jsonPrimitive
@@ -82,166 +80,84 @@ fun createProjectPostTool(): Tool {
 fun createProjectPostHandler(
     doorayClient: DoorayClient
 ): suspend (CallToolRequest) -> CallToolResult {
-    return { request ->
-        try {
-            val projectId = request.arguments["project_id"]?.jsonPrimitive?.content
-            val subject = request.arguments["subject"]?.jsonPrimitive?.content
-            val body = request.arguments["body"]?.jsonPrimitive?.content
-            val toMemberIds =
-                request.arguments["to_member_ids"]?.let { element ->
-                    JsonUtils.parseStringArray(element.toString())
-                }
-
-            when {
-                projectId == null -> {
-                    val errorResponse =
-                        ToolException(
-                            type = ToolException.PARAMETER_MISSING,
-                            message = "project_id 파라미터가 필요합니다. 프로젝트 ID를 입력하세요.",
-                            code = "MISSING_PROJECT_ID"
-                        )
-                            .toErrorResponse()
-
-                    CallToolResult(
-                        content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-                    )
-                }
-
-                subject == null -> {
-                    val errorResponse =
-                        ToolException(
-                            type = ToolException.PARAMETER_MISSING,
-                            message = "subject 파라미터가 필요합니다. 업무 제목을 입력하세요.",
-                            code = "MISSING_SUBJECT"
-                        )
-                            .toErrorResponse()
-
-                    CallToolResult(
-                        content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-                    )
-                }
-
-                body == null -> {
-                    val errorResponse =
-                        ToolException(
-                            type = ToolException.PARAMETER_MISSING,
-                            message = "body 파라미터가 필요합니다. 업무 내용을 입력하세요.",
-                            code = "MISSING_BODY"
-                        )
-                            .toErrorResponse()
-
-                    CallToolResult(
-                        content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-                    )
-                }
-
-                toMemberIds == null || toMemberIds.isEmpty() -> {
-                    val errorResponse =
-                        ToolException(
-                            type = ToolException.PARAMETER_MISSING,
-                            message =
-                                "to_member_ids 파라미터가 필요합니다. 담당자 멤버 ID 목록을 입력하세요.",
-                            code = "MISSING_TO_MEMBER_IDS"
-                        )
-                            .toErrorResponse()
-
-                    CallToolResult(
-                        content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-                    )
-                }
-
-                else -> {
-                    // 선택적 파라미터 처리
-                    val ccMemberIds =
-                        request.arguments["cc_member_ids"]?.let { element ->
-                            JsonUtils.parseStringArray(element.toString())
-                        }
-                            ?: emptyList()
-
-                    val parentPostId = request.arguments["parent_post_id"]?.jsonPrimitive?.content
-                    val dueDate = request.arguments["due_date"]?.jsonPrimitive?.content
-                    val milestoneId = request.arguments["milestone_id"]?.jsonPrimitive?.content
-                    val tagIds =
-                        request.arguments["tag_ids"]?.let { element ->
-                            JsonUtils.parseStringArray(element.toString())
-                        }
-                            ?: emptyList()
-                    val priority = request.arguments["priority"]?.jsonPrimitive?.content ?: "none"
-
-                    // 담당자 목록 생성
-                    val toUsers =
-                        toMemberIds.map { memberId ->
-                            CreatePostUser(
-                                type = "member",
-                                member = Member(organizationMemberId = memberId)
-                            )
-                        }
-
-                    // 참조자 목록 생성
-                    val ccUsers =
-                        ccMemberIds.map { memberId ->
-                            CreatePostUser(
-                                type = "member",
-                                member = Member(organizationMemberId = memberId)
-                            )
-                        }
-
-                    val createRequest =
-                        CreatePostRequest(
-                            parentPostId = parentPostId,
-                            users = CreatePostUsers(to = toUsers, cc = ccUsers),
-                            subject = subject,
-                            body = PostBody(mimeType = "text/x-markdown", content = body),
-                            dueDate = dueDate,
-                            milestoneId = milestoneId,
-                            tagIds = tagIds,
-                            priority = priority
-                        )
-
-                    val response = doorayClient.createPost(projectId, createRequest)
-
-                    if (response.header.isSuccessful) {
-                        val nextStepHint =
-                            "\n\n💡 다음 가능한 작업:\n" +
-                                    "- dooray_project_get_post: 생성된 업무 상세 조회\n" +
-                                    "- dooray_project_list_posts: 프로젝트 업무 목록 조회"
-
-                        val successResponse =
-                            ToolSuccessResponse(
-                                data = response.result,
-                                message =
-                                    "✅ 업무를 성공적으로 생성했습니다 (업무 ID: ${response.result.id})$nextStepHint"
-                            )
+    return runTool { request ->
+        val projectId =
+            request.arguments["project_id"]?.jsonPrimitive?.content
+                ?: return@runTool parameterMissing(
+                    "project_id 파라미터가 필요합니다. 프로젝트 ID를 입력하세요.",
+                    "MISSING_PROJECT_ID"
+                )
+        val subject =
+            request.arguments["subject"]?.jsonPrimitive?.content
+                ?: return@runTool parameterMissing(
+                    "subject 파라미터가 필요합니다. 업무 제목을 입력하세요.",
+                    "MISSING_SUBJECT"
+                )
+        val body =
+            request.arguments["body"]?.jsonPrimitive?.content
+                ?: return@runTool parameterMissing(
+                    "body 파라미터가 필요합니다. 업무 내용을 입력하세요.",
+                    "MISSING_BODY"
+                )
+        val toMemberIds =
+            request.arguments["to_member_ids"]?.let(JsonUtils::toStringList)
+
+        if (toMemberIds.isNullOrEmpty()) {
+            return@runTool parameterMissing(
+                "to_member_ids 파라미터가 필요합니다. 담당자 멤버 ID 목록을 입력하세요.",
+                "MISSING_TO_MEMBER_IDS"
+            )
+        }
 
-                        CallToolResult(
-                            content =
-                                listOf(TextContent(JsonUtils.toJsonString(successResponse)))
-                        )
-                    } else {
-                        val errorResponse =
-                            ToolException(
-                                type = ToolException.API_ERROR,
-                                message = response.header.resultMessage,
-                                code = "DOORAY_API_${response.header.resultCode}"
-                            )
-                                .toErrorResponse()
+        // 선택적 파라미터 처리
+        val ccMemberIds =
+            request.arguments["cc_member_ids"]?.let(JsonUtils::toStringList) ?: emptyList()
+
+        val parentPostId = request.arguments["parent_post_id"]?.jsonPrimitive?.content
+        val dueDate = request.arguments["due_date"]?.jsonPrimitive?.content
+        val milestoneId = request.arguments["milestone_id"]?.jsonPrimitive?.content
+        val tagIds =
+            request.arguments["tag_ids"]?.let(JsonUtils::toStringList) ?: emptyList()
+        val priority = request.arguments["priority"]?.jsonPrimitive?.content ?: "none"
+
+        // 담당자 목록 생성
+        val toUsers =
+            toMemberIds.map { memberId ->
+                CreatePostUser(type = "member", member = Member(organizationMemberId = memberId))
+            }
 
-                        CallToolResult(
-                            content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-                        )
-                    }
-                }
+        // 참조자 목록 생성
+        val ccUsers =
+            ccMemberIds.map { memberId ->
+                CreatePostUser(type = "member", member = Member(organizationMemberId = memberId))
             }
-        } catch (e: Exception) {
-            val errorResponse =
-                ToolException(
-                    type = ToolException.INTERNAL_ERROR,
-                    message = "내부 오류가 발생했습니다: ${e.message}",
-                    details = e.stackTraceToString()
-                )
-                    .toErrorResponse()
 
-            CallToolResult(content = listOf(TextContent(JsonUtils.toJsonString(errorResponse))))
+        val createRequest =
+            CreatePostRequest(
+                parentPostId = parentPostId,
+                users = CreatePostUsers(to = toUsers, cc = ccUsers),
+                subject = subject,
+                body = PostBody(mimeType = "text/x-markdown", content = body),
+                dueDate = dueDate,
+                milestoneId = milestoneId,
+                tagIds = tagIds,
+                priority = priority
+            )
+
+        val response = doorayClient.createPost(projectId, createRequest)
+
+        if (!response.header.isSuccessful) {
+            return@runTool response.header.toApiErrorResult()
         }
+
+        val nextStepHint =
+            "\n\n💡 다음 가능한 작업:\n" +
+                    "- dooray_project_get_post: 생성된 업무 상세 조회\n" +
+                    "- dooray_project_list_posts: 프로젝트 업무 목록 조회"
+
+        toolSuccess(
+            data = response.result,
+            message = "✅ 업무를 성공적으로 생성했습니다 (업무 ID: ${response.result.id})$nextStepHint"
+        )
     }
 }
@@ -115,22 +115,18 @@ fun getCalendarDetailHandler(doorayClient: DoorayClient): suspend (CallToolReque
                     content = listOf(TextContent(JsonUtils.toJsonString(successResponse)))
                 )
             } else {
-                val errorResponse = ToolException(
+                ToolException(
                     type = ToolException.API_ERROR,
                     message = response.header.resultMessage,
                     code = "DOORAY_API_${response.header.resultCode}"
-                ).toErrorResponse()
-                
-                CallToolResult(content = listOf(TextContent(JsonUtils.toJsonString(errorResponse))))
+                ).toCallToolResult()
             }
         } catch (e: Exception) {
-            val errorResponse = ToolException(
+            ToolException(
                 type = ToolException.INTERNAL_ERROR,
                 message = "캘린더 상세 조회 중 오류가 발생했습니다: ${e.message}",
                 details = e.stackTraceToString()
-            ).toErrorResponse()
-            
-            CallToolResult(content = listOf(TextContent(JsonUtils.toJsonString(errorResponse))))
+            ).toCallToolResult()
         }
     }
 }
\ No newline at end of file
@@ -2,7 +2,6 @@ package com.bifos.dooray.mcp.tools
 
 import com.bifos.dooray.mcp.client.DoorayClient
 import com.bifos.dooray.mcp.exception.ToolException
-import com.bifos.dooray.mcp.types.CalendarEventsResponse
 import com.bifos.dooray.mcp.types.ToolSuccessResponse
 import com.bifos.dooray.mcp.utils.JsonUtils
 import io.modelcontextprotocol.kotlin.sdk.CallToolRequest
@@ -13,8 +12,6 @@ import kotlinx.serialization.json.buildJsonObject
 import kotlinx.serialization.json.jsonPrimitive
 import kotlinx.serialization.json.put
 import kotlinx.serialization.json.putJsonObject
-import java.net.URLEncoder
-import java.nio.charset.StandardCharsets
 
 fun getCalendarEventsTool(): Tool {
     return Tool(
@@ -73,22 +70,18 @@ fun getCalendarEventsHandler(doorayClient: DoorayClient): suspend (CallToolReque
                     content = listOf(TextContent(JsonUtils.toJsonString(successResponse)))
                 )
             } else {
-                val errorResponse = ToolException(
+                ToolException(
                     type = ToolException.API_ERROR,
                     message = response.header.resultMessage,
                     code = "DOORAY_API_${response.header.resultCode}"
-                ).toErrorResponse()
-                
-                CallToolResult(content = listOf(TextContent(JsonUtils.toJsonString(errorResponse))))
+                ).toCallToolResult()
             }
         } catch (e: Exception) {
-            val errorResponse = ToolException(
+            ToolException(
                 type = ToolException.INTERNAL_ERROR,
                 message = "캘린더 일정 조회 중 오류가 발생했습니다: ${e.message}",
                 details = e.stackTraceToString()
-            ).toErrorResponse()
-            
-            CallToolResult(content = listOf(TextContent(JsonUtils.toJsonString(errorResponse))))
+            ).toCallToolResult()
         }
     }
 }
\ No newline at end of file
@@ -2,7 +2,6 @@ package com.bifos.dooray.mcp.tools
 
 import com.bifos.dooray.mcp.client.DoorayClient
 import com.bifos.dooray.mcp.exception.ToolException
-import com.bifos.dooray.mcp.types.CalendarListResponse
 import com.bifos.dooray.mcp.types.ToolSuccessResponse
 import com.bifos.dooray.mcp.utils.JsonUtils
 import io.modelcontextprotocol.kotlin.sdk.CallToolRequest
@@ -40,22 +39,18 @@ fun getCalendarsHandler(doorayClient: DoorayClient): suspend (CallToolRequest) -
                     content = listOf(TextContent(JsonUtils.toJsonString(successResponse)))
                 )
             } else {
-                val errorResponse = ToolException(
+                ToolException(
                     type = ToolException.API_ERROR,
                     message = response.header.resultMessage,
                     code = "DOORAY_API_${response.header.resultCode}"
-                ).toErrorResponse()
-                
-                CallToolResult(content = listOf(TextContent(JsonUtils.toJsonString(errorResponse))))
+                ).toCallToolResult()
             }
         } catch (e: Exception) {
-            val errorResponse = ToolException(
+            ToolException(
                 type = ToolException.INTERNAL_ERROR,
                 message = "캘린더 목록 조회 중 오류가 발생했습니다: ${e.message}",
                 details = e.stackTraceToString()
-            ).toErrorResponse()
-            
-            CallToolResult(content = listOf(TextContent(JsonUtils.toJsonString(errorResponse))))
+            ).toCallToolResult()
         }
     }
 }
\ No newline at end of file
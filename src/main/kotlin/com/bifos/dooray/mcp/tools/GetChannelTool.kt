@@ -36,15 +36,11 @@ fun getChannelHandler(doorayClient: DoorayClient): suspend (CallToolRequest) ->
 
             when {
                 channelId.isNullOrBlank() -> {
-                    val errorResponse = ToolException(
+                    ToolException(
                         type = ToolException.PARAMETER_MISSING,
                         message = "channelId 파라미터가 필요합니다.",
                         code = "MISSING_CHANNEL_ID"
-                    ).toErrorResponse()
-
-                    CallToolResult(
-                        content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-                    )
+                    ).toCallToolResult()
                 }
                 else -> {
                     val channel = doorayClient.getChannel(channelId)
@@ -58,33 +54,22 @@ fun getChannelHandler(doorayClient: DoorayClient): suspend (CallToolRequest) ->
                             content = listOf(TextContent(JsonUtils.toJsonString(successResponse)))
                         )
                     } else {
-                        val errorResponse = ToolException(
+                        ToolException(
                             type = ToolException.API_ERROR,
                             message = "채널을 찾을 수 없습니다. 채널 ID를 확인해주세요: $channelId",
                             code = "CHANNEL_NOT_FOUND"
-                        ).toErrorResponse()
-
-                        CallToolResult(
-                            content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-                        )
+                        ).toCallToolResult()
                     }
                 }
             }
         } catch (e: ToolException) {
-            val errorResponse = e.toErrorResponse()
-            CallToolResult(
-                content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-            )
+            e.toCallToolResult()
         } catch (e: Exception) {
-            val errorResponse = ToolException(
+            ToolException(
                 type = ToolException.INTERNAL_ERROR,
                 message = "채널 정보 조회 중 오류가 발생했습니다: ${e.message}",
                 code = "GET_CHANNEL_ERROR"
-            ).toErrorResponse()
-
-            CallToolResult(
-                content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-            )
+            ).toCallToolResult()
         }
     }
 }
\ No newline at end of file
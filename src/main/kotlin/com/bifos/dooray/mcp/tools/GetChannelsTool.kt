@@ -73,31 +73,20 @@ fun getChannelsHandler(doorayClient: DoorayClient): suspend (CallToolRequest) ->
                     content = listOf(TextContent(JsonUtils.toJsonString(successResponse)))
                 )
             } else {
-                val errorResponse = ToolException(
+                ToolException(
                     type = ToolException.API_ERROR,
                     message = "채널 목록 조회 실패: ${response.header.resultMessage}",
                     code = "GET_CHANNELS_FAILED"
-                ).toErrorResponse()
-                
-                CallToolResult(
-                    content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-                )
+                ).toCallToolResult()
             }
         } catch (e: ToolException) {
-            val errorResponse = e.toErrorResponse()
-            CallToolResult(
-                content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-            )
+            e.toCallToolResult()
         } catch (e: Exception) {
-            val errorResponse = ToolException(
+            ToolException(
                 type = ToolException.INTERNAL_ERROR,
                 message = "채널 목록 조회 중 오류가 발생했습니다: ${e.message}",
                 code = "GET_CHANNELS_ERROR"
-            ).toErrorResponse()
-            
-            CallToolResult(
-                content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-            )
+            ).toCallToolResult()
         }
     }
 }
\ No newline at end of file
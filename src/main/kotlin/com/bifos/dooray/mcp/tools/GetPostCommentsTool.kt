@@ -1,9 +1,7 @@
 package com.bifos.dooray.mcp.tools
 
 import com.bifos.dooray.mcp.client.DoorayClient
-import com.bifos.dooray.mcp.exception.ToolException
-import com.bifos.dooray.mcp.types.PostCommentsResponseData
-import com.bifos.dooray.mcp.types.ToolSuccessResponse
+import com.bifos.dooray.mcp.types.ListResponseHeader
 import com.bifos.dooray.mcp.utils.JsonUtils
 import io.modelcontextprotocol.kotlin.sdk.CallToolRequest
 import io.modelcontextprotocol.kotlin.sdk.CallToolResult
@@ -17,7 +15,9 @@ import kotlinx.serialization.json.putJsonObject
 fun getPostCommentsTool(): Tool {
     return Tool(
             name = "dooray_project_get_post_comments",
-            description = "두레이 프로젝트 업무의 댓글 목록을 조회합니다. 페이징과 정렬 옵션을 지원합니다.",
+            description =
+                    "두레이 프로젝트 업무의 댓글 목록을 조회합니다. 페이징과 정렬 옵션을 지원합니다. " +
+                            "응답은 JSON Lines 형식입니다 (첫 줄: 메타데이터, 이후 한 줄에 댓글 하나).",
             inputSchema =
                     Tool.Input(
                             properties =
@@ -65,82 +65,37 @@ fun getPostCommentsTool(): Tool {
 fun getPostCommentsHandler(
         doorayClient: DoorayClient
 ): suspend (CallToolRequest) -> CallToolResult {
-    return handler@{ request ->
-        try {
-            val projectId = request.arguments["project_id"]?.jsonPrimitive?.content
-            val postId = request.arguments["post_id"]?.jsonPrimitive?.content
-            val page = request.arguments["page"]?.jsonPrimitive?.content?.toIntOrNull()
-            val size = request.arguments["size"]?.jsonPrimitive?.content?.toIntOrNull()
-            val order = request.arguments["order"]?.jsonPrimitive?.content
+    return runTool { request ->
+        val projectId = request.arguments["project_id"]?.jsonPrimitive?.content
+        val postId = request.arguments["post_id"]?.jsonPrimitive?.content
+        val page = request.arguments["page"]?.jsonPrimitive?.content?.toIntOrNull()
+        val size = request.arguments["size"]?.jsonPrimitive?.content?.toIntOrNull()
+        val order = request.arguments["order"]?.jsonPrimitive?.content
 
-            if (projectId.isNullOrBlank()) {
-                val errorResponse =
-                        ToolException(
-                                        type = ToolException.PARAMETER_MISSING,
-                                        message = "project_id 파라미터가 필요합니다.",
-                                        code = "MISSING_PROJECT_ID"
-                                )
-                                .toErrorResponse()
-
-                return@handler CallToolResult(
-                        content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-                )
-            }
-
-            if (postId.isNullOrBlank()) {
-                val errorResponse =
-                        ToolException(
-                                        type = ToolException.PARAMETER_MISSING,
-                                        message = "post_id 파라미터가 필요합니다.",
-                                        code = "MISSING_POST_ID"
-                                )
-                                .toErrorResponse()
+        if (projectId.isNullOrBlank()) {
+            return@runTool parameterMissing("project_id 파라미터가 필요합니다.", "MISSING_PROJECT_ID")
+        }
 
-                return@handler CallToolResult(
-                        content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-                )
-            }
+        if (postId.isNullOrBlank()) {
+            return@runTool parameterMissing("post_id 파라미터가 필요합니다.", "MISSING_POST_ID")
+        }
 
-            val response = doorayClient.getPostComments(projectId, postId, page, size, order)
+        val response = doorayClient.getPostComments(projectId, postId, page, size, order)
 
-            if (response.header.isSuccessful) {
-                val successResponse =
-                        ToolSuccessResponse(
-                                data =
-                                        PostCommentsResponseData(
-                                                comments = response.result,
-                                                totalCount = response.totalCount,
-                                                currentPage = page ?: 0,
-                                                pageSize = size ?: 20
-                                        ),
-                                message =
-                                        "업무 댓글 목록을 성공적으로 조회했습니다. (총 ${response.totalCount}개, 현재 페이지: ${response.result.size}개)"
-                        )
+        if (!response.header.isSuccessful) {
+            return@runTool response.header.toApiErrorResult()
+        }
 
-                CallToolResult(
-                        content = listOf(TextContent(JsonUtils.toJsonString(successResponse)))
+        val header =
+                ListResponseHeader(
+                        message =
+                                "업무 댓글 목록을 성공적으로 조회했습니다. (총 ${response.totalCount}개, 현재 페이지: ${response.result.size}개)",
+                        totalCount = response.totalCount,
+                        currentPage = page ?: 0,
+                        pageSize = size ?: 20
                 )
-            } else {
-                val errorResponse =
-                        ToolException(
-                                        type = ToolException.API_ERROR,
-                                        message = response.header.resultMessage,
-                                        code = "DOORAY_API_${response.header.resultCode}"
-                                )
-                                .toErrorResponse()
 
-                CallToolResult(content = listOf(TextContent(JsonUtils.toJsonString(errorResponse))))
-            }
-        } catch (e: Exception) {
-            val errorResponse =
-                    ToolException(
-                                    type = ToolException.INTERNAL_ERROR,
-                                    message = "내부 오류가 발생했습니다: ${e.message}",
-                                    details = e.stackTraceToString()
-                            )
-                            .toErrorResponse()
-
-            CallToolResult(content = listOf(TextContent(JsonUtils.toJsonString(errorResponse))))
-        }
+        val text = JsonUtils.toJsonLinesAsync(header, response.result)
+        CallToolResult(content = listOf(TextContent(text)))
     }
 }
@@ -0,0 +1,93 @@
+package com.bifos.dooray.mcp.tools
+
+import com.bifos.dooray.mcp.client.DoorayClient
+import com.bifos.dooray.mcp.types.PostWithCommentsResponseData
+import io.modelcontextprotocol.kotlin.sdk.CallToolRequest
+import io.modelcontextprotocol.kotlin.sdk.CallToolResult
+import io.modelcontextprotocol.kotlin.sdk.Tool
+import kotlinx.coroutines.async
+import kotlinx.coroutines.coroutineScope
+import kotlinx.serialization.json.buildJsonObject
+import kotlinx.serialization.json.jsonPrimitive
+import kotlinx.serialization.json.put
+import kotlinx.serialization.json.putJsonObject
+
+/** 업무와 함께 조회할 댓글 수 (첫 페이지) */
+private const val COMMENT_PAGE_SIZE = 50
+
+fun getProjectPostWithCommentsTool(): Tool {
+    return Tool(
+        name = "dooray_project_get_post_with_comments",
+        description =
+            "두레이 프로젝트 업무의 상세 정보와 댓글 목록(최대 ${COMMENT_PAGE_SIZE}개)을 한 번에 조회합니다. 업무와 댓글을 동시에 요청하므로 두 도구를 차례로 호출하는 것보다 빠릅니다.",
+        inputSchema =
+            Tool.Input(
+                properties =
+                    buildJsonObject {
+                        putJsonObject("project_id") {
+                            put("type", "string")
+                            put(
+                                "description",
+                                "프로젝트 ID (dooray_project_list_projects로 조회 가능)"
+                            )
+                        }
+                        putJsonObject("post_id") {
+                            put("type", "string")
+                            put("description", "업무 ID (dooray_project_list_posts로 조회 가능)")
+                        }
+                    },
+                required = listOf("project_id", "post_id")
+            ),
+        outputSchema = null,
+        annotations = null
+    )
+}
+
+fun getProjectPostWithCommentsHandler(
+    doorayClient: DoorayClient
+): suspend (CallToolRequest) -> CallToolResult {
+    return runTool { request ->
+        val projectId = request.arguments["project_id"]?.jsonPrimitive?.content
+        val postId = request.arguments["post_id"]?.jsonPrimitive?.content
+
+        if (projectId.isNullOrBlank()) {
+            return@runTool parameterMissing(
+                "project_id 파라미터가 필요합니다. 프로젝트 ID를 입력하세요.",
+                "MISSING_PROJECT_ID"
+            )
+        }
+
+        if (postId.isNullOrBlank()) {
+            return@runTool parameterMissing(
+                "post_id 파라미터가 필요합니다. dooray_project_list_posts를 사용해서 업무 ID를 먼저 조회하세요.",
+                "MISSING_POST_ID"
+            )
+        }
+
+        // 업무 상세와 댓글 목록은 서로 독립적이므로 동시에 요청합니다 (지연시간: t1 + t2 -> max(t1, t2))
+        val (postResponse, commentsResponse) =
+            coroutineScope {
+                val post = async { doorayClient.getPost(projectId, postId) }
+                val comments = async {
+                    doorayClient.getPostComments(projectId, postId, 0, COMMENT_PAGE_SIZE, null)
+                }
+                post.await() to comments.await()
+            }
+
+        listOf(postResponse.header, commentsResponse.header)
+            .firstOrNull { !it.isSuccessful }
+            ?.let { failedHeader -> return@runTool failedHeader.toApiErrorResult() }
+
+        val post = postResponse.result
+        toolSuccess(
+            data =
+                PostWithCommentsResponseData(
+                    post = post,
+                    comments = commentsResponse.result,
+                    totalCommentCount = commentsResponse.totalCount
+                ),
+            message =
+                "📋 업무 상세 정보와 댓글을 성공적으로 조회했습니다 (업무번호: ${post.taskNumber}, 댓글 총 ${commentsResponse.totalCount}개 중 ${commentsResponse.result.size}개)"
+        )
+    }
+}
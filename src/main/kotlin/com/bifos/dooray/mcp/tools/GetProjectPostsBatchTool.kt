@@ -0,0 +1,134 @@
+package com.bifos.dooray.mcp.tools
+
+import com.bifos.dooray.mcp.client.DoorayClient
+import com.bifos.dooray.mcp.exception.ToolException
+import com.bifos.dooray.mcp.types.PostBatchItem
+import com.bifos.dooray.mcp.types.PostBatchResponseHeader
+import com.bifos.dooray.mcp.utils.JsonUtils
+import io.modelcontextprotocol.kotlin.sdk.CallToolRequest
+import io.modelcontextprotocol.kotlin.sdk.CallToolResult
+import io.modelcontextprotocol.kotlin.sdk.TextContent
+import io.modelcontextprotocol.kotlin.sdk.Tool
+import kotlinx.coroutines.CancellationException
+import kotlinx.coroutines.async
+import kotlinx.coroutines.awaitAll
+import kotlinx.coroutines.coroutineScope
+import kotlinx.coroutines.sync.Semaphore
+import kotlinx.coroutines.sync.withPermit
+import kotlinx.serialization.json.buildJsonObject
+import kotlinx.serialization.json.jsonPrimitive
+import kotlinx.serialization.json.put
+import kotlinx.serialization.json.putJsonObject
+
+/** 한 번에 조회할 수 있는 최대 업무 수 */
+private const val MAX_BATCH_SIZE = 50
+
+/** 두레이 API 요청 제한을 고려한 최대 동시 요청 수 */
+private const val MAX_CONCURRENT_REQUESTS = 10
+
+fun getProjectPostsBatchTool(): Tool {
+    return Tool(
+        name = "dooray_project_get_posts_batch",
+        description =
+            "두레이 프로젝트의 여러 업무 상세 정보를 한 번에 조회합니다 (최대 ${MAX_BATCH_SIZE}개). 업무들을 동시에 요청하므로 dooray_project_get_post를 여러 번 호출하는 것보다 빠릅니다. " +
+                    "응답은 JSON Lines 형식입니다 (첫 줄: 메타데이터, 이후 요청 순서대로 한 줄에 업무 하나).",
+        inputSchema =
+            Tool.Input(
+                properties =
+                    buildJsonObject {
+                        putJsonObject("project_id") {
+                            put("type", "string")
+                            put("description", "프로젝트 ID (필수)")
+                        }
+                        putJsonObject("post_ids") {
+                            put("type", "array")
+                            putJsonObject("items") { put("type", "string") }
+                            put(
+                                "description",
+                                "조회할 업무 ID 목록 (dooray_project_list_posts로 조회 가능) (필수)"
+                            )
+                        }
+                    },
+                required = listOf("project_id", "post_ids")
+            ),
+        outputSchema = null,
+        annotations = null
+    )
+}
+
+fun getProjectPostsBatchHandler(
+    doorayClient: DoorayClient
+): suspend (CallToolRequest) -> CallToolResult {
+    // 동시 요청 제한은 호출마다가 아니라 이 도구의 모든 호출에 함께 적용되어야 두레이 rate limit 을 지킬 수 있습니다.
+    val semaphore = Semaphore(MAX_CONCURRENT_REQUESTS)
+    return runTool { request ->
+        val projectId =
+            request.arguments["project_id"]?.jsonPrimitive?.content
+                ?: return@runTool parameterMissing(
+                    "project_id 파라미터가 필요합니다. 프로젝트 ID를 입력하세요.",
+                    "MISSING_PROJECT_ID"
+                )
+        val postIds =
+            request.arguments["post_ids"]?.let(JsonUtils::toStringList)?.distinct()
+
+        if (postIds.isNullOrEmpty()) {
+            return@runTool parameterMissing(
+                "post_ids 파라미터가 필요합니다. 조회할 업무 ID 목록을 입력하세요.",
+                "MISSING_POST_IDS"
+            )
+        }
+
+        if (postIds.size > MAX_BATCH_SIZE) {
+            return@runTool ToolException(
+                type = ToolException.VALIDATION_ERROR,
+                message = "post_ids 는 최대 ${MAX_BATCH_SIZE}개까지 조회할 수 있습니다. (요청: ${postIds.size}개)",
+                code = "TOO_MANY_POST_IDS"
+            )
+                .toCallToolResult()
+        }
+
+        // 업무별 실패가 전체 조회를 중단시키지 않도록 항목마다 결과/에러를 따로 기록합니다.
+        val items =
+            coroutineScope {
+                postIds
+                    .map { postId ->
+                        async { semaphore.withPermit { fetchPost(doorayClient, projectId, postId) } }
+                    }
+                    .awaitAll()
+            }
+
+        val failedCount = items.count { it.error != null }
+        val header =
+            PostBatchResponseHeader(
+                message =
+                    "📋 업무 ${items.size}개 중 ${items.size - failedCount}개를 성공적으로 조회했습니다" +
+                            if (failedCount > 0) " (실패 ${failedCount}개, 각 항목의 error 확인)" else "",
+                totalCount = items.size,
+                failedCount = failedCount
+            )
+
+        CallToolResult(content = listOf(TextContent(JsonUtils.toJsonLines(header, items))))
+    }
+}
+
+private suspend fun fetchPost(
+    doorayClient: DoorayClient,
+    projectId: String,
+    postId: String
+): PostBatchItem {
+    return try {
+        val response = doorayClient.getPost(projectId, postId)
+        if (response.header.isSuccessful) {
+            PostBatchItem(postId = postId, post = response.result)
+        } else {
+            PostBatchItem(
+                postId = postId,
+                error = "DOORAY_API_${response.header.resultCode}: ${response.header.resultMessage}"
+            )
+        }
+    } catch (e: CancellationException) {
+        throw e
+    } catch (e: Exception) {
+        PostBatchItem(postId = postId, error = e.message ?: e::class.simpleName)
+    }
+}
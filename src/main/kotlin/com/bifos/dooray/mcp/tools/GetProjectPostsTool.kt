@@ -1,8 +1,7 @@
 package com.bifos.dooray.mcp.tools
 
 import com.bifos.dooray.mcp.client.DoorayClient
-import com.bifos.dooray.mcp.exception.ToolException
-import com.bifos.dooray.mcp.types.ToolSuccessResponse
+import com.bifos.dooray.mcp.types.ListResponseHeader
 import com.bifos.dooray.mcp.utils.JsonUtils
 import io.modelcontextprotocol.kotlin.sdk.CallToolRequest
 import io.modelcontextprotocol.kotlin.sdk.CallToolResult
@@ -16,7 +15,9 @@ import kotlinx.serialization.json.putJsonObject
 fun getProjectPostsTool(): Tool {
     return Tool(
         name = "dooray_project_list_posts",
-        description = "두레이 프로젝트의 업무 목록을 조회합니다. 다양한 필터 조건과 정렬 옵션을 지원합니다.",
+        description =
+            "두레이 프로젝트의 업무 목록을 조회합니다. 다양한 필터 조건과 정렬 옵션을 지원합니다. " +
+                    "응답은 JSON Lines 형식입니다 (첫 줄: 메타데이터, 이후 한 줄에 업무 하나).",
         inputSchema =
             Tool.Input(
                 properties =
@@ -92,111 +93,73 @@ fun getProjectPostsTool(): Tool {
 fun getProjectPostsHandler(
     doorayClient: DoorayClient
 ): suspend (CallToolRequest) -> CallToolResult {
-    return { request ->
-        try {
-            val projectId = request.arguments["project_id"]?.jsonPrimitive?.content
-
-            if (projectId == null) {
-                val errorResponse =
-                    ToolException(
-                        type = ToolException.PARAMETER_MISSING,
-                        message = "project_id 파라미터가 필요합니다. 프로젝트 ID를 입력하세요.",
-                        code = "MISSING_PROJECT_ID"
-                    )
-                        .toErrorResponse()
-
-                CallToolResult(content = listOf(TextContent(JsonUtils.toJsonString(errorResponse))))
-            } else {
-                val page = request.arguments["page"]?.jsonPrimitive?.content?.toIntOrNull() ?: 0
-                val size = request.arguments["size"]?.jsonPrimitive?.content?.toIntOrNull() ?: 20
-
-                // 배열 파라미터 처리
-                val toMemberIds =
-                    request.arguments["to_member_ids"]?.let { element ->
-                        JsonUtils.parseStringArray(element.toString())
-                    }
-                val ccMemberIds =
-                    request.arguments["cc_member_ids"]?.let { element ->
-                        JsonUtils.parseStringArray(element.toString())
-                    }
-                val tagIds =
-                    request.arguments["tag_ids"]?.let { element ->
-                        JsonUtils.parseStringArray(element.toString())
-                    }
-                val postWorkflowClasses =
-                    request.arguments["post_workflow_classes"]?.let { element ->
-                        JsonUtils.parseStringArray(element.toString())
-                    }
-                val milestoneIds =
-                    request.arguments["milestone_ids"]?.let { element ->
-                        JsonUtils.parseStringArray(element.toString())
-                    }
+    return runTool { request ->
+        val projectId =
+            request.arguments["project_id"]?.jsonPrimitive?.content
+                ?: return@runTool parameterMissing(
+                    "project_id 파라미터가 필요합니다. 프로젝트 ID를 입력하세요.",
+                    "MISSING_PROJECT_ID"
+                )
 
-                // 단일 값 파라미터 처리
-                val parentPostId = request.arguments["parent_post_id"]?.jsonPrimitive?.content
-                val subjects = request.arguments["subjects"]?.jsonPrimitive?.content
-                val order = request.arguments["order"]?.jsonPrimitive?.content
+        val page = request.arguments["page"]?.jsonPrimitive?.content?.toIntOrNull() ?: 0
+        val size = request.arguments["size"]?.jsonPrimitive?.content?.toIntOrNull() ?: 20
 
-                val response =
-                    doorayClient.getPosts(
-                        projectId = projectId,
-                        page = page,
-                        size = size,
-                        toMemberIds = toMemberIds,
-                        ccMemberIds = ccMemberIds,
-                        tagIds = tagIds,
-                        parentPostId = parentPostId,
-                        postWorkflowClasses = postWorkflowClasses,
-                        milestoneIds = milestoneIds,
-                        subjects = subjects,
-                        order = order
-                    )
+        // 배열 파라미터 처리
+        val toMemberIds =
+            request.arguments["to_member_ids"]?.let(JsonUtils::toStringList)
+        val ccMemberIds =
+            request.arguments["cc_member_ids"]?.let(JsonUtils::toStringList)
+        val tagIds =
+            request.arguments["tag_ids"]?.let(JsonUtils::toStringList)
+        val postWorkflowClasses =
+            request.arguments["post_workflow_classes"]?.let(JsonUtils::toStringList)
+        val milestoneIds =
+            request.arguments["milestone_ids"]?.let(JsonUtils::toStringList)
 
-                if (response.header.isSuccessful) {
-                    val pageInfo = if (page == 0) "첫 번째 페이지" else "${page + 1}번째 페이지"
+        // 단일 값 파라미터 처리
+        val parentPostId = request.arguments["parent_post_id"]?.jsonPrimitive?.content
+        val subjects = request.arguments["subjects"]?.jsonPrimitive?.content
+        val order = request.arguments["order"]?.jsonPrimitive?.content
 
-                    val nextStepHint =
-                        if (response.result.isNotEmpty()) {
-                            "\n\n💡 다음 단계: 특정 업무의 상세 정보를 보려면 dooray_project_get_post를 사용하세요."
-                        } else {
-                            if (page == 0) "\n\n📋 조회 결과가 없습니다. 필터 조건을 확인해주세요."
-                            else "\n\n📄 더 이상 업무가 없습니다."
-                        }
+        val response =
+            doorayClient.getPosts(
+                projectId = projectId,
+                page = page,
+                size = size,
+                toMemberIds = toMemberIds,
+                ccMemberIds = ccMemberIds,
+                tagIds = tagIds,
+                parentPostId = parentPostId,
+                postWorkflowClasses = postWorkflowClasses,
+                milestoneIds = milestoneIds,
+                subjects = subjects,
+                order = order
+            )
 
-                    val successResponse =
-                        ToolSuccessResponse(
-                            data = response.result,
-                            message =
-                                "📋 프로젝트 업무 목록을 성공적으로 조회했습니다 ($pageInfo, 총 ${response.result.size}개)$nextStepHint"
-                        )
+        if (!response.header.isSuccessful) {
+            return@runTool response.header.toApiErrorResult()
+        }
 
-                    CallToolResult(
-                        content = listOf(TextContent(JsonUtils.toJsonString(successResponse)))
-                    )
-                } else {
-                    val errorResponse =
-                        ToolException(
-                            type = ToolException.API_ERROR,
-                            message = response.header.resultMessage,
-                            code = "DOORAY_API_${response.header.resultCode}"
-                        )
-                            .toErrorResponse()
+        val pageInfo = if (page == 0) "첫 번째 페이지" else "${page + 1}번째 페이지"
 
-                    CallToolResult(
-                        content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-                    )
-                }
+        val nextStepHint =
+            if (response.result.isNotEmpty()) {
+                "\n\n💡 다음 단계: 특정 업무의 상세 정보를 보려면 dooray_project_get_post를 사용하세요."
+            } else {
+                if (page == 0) "\n\n📋 조회 결과가 없습니다. 필터 조건을 확인해주세요."
+                else "\n\n📄 더 이상 업무가 없습니다."
             }
-        } catch (e: Exception) {
-            val errorResponse =
-                ToolException(
-                    type = ToolException.INTERNAL_ERROR,
-                    message = "내부 오류가 발생했습니다: ${e.message}",
-                    details = e.stackTraceToString()
-                )
-                    .toErrorResponse()
 
-            CallToolResult(content = listOf(TextContent(JsonUtils.toJsonString(errorResponse))))
-        }
+        val header =
+            ListResponseHeader(
+                message =
+                    "📋 프로젝트 업무 목록을 성공적으로 조회했습니다 ($pageInfo, 총 ${response.result.size}개)$nextStepHint",
+                totalCount = response.totalCount,
+                currentPage = page,
+                pageSize = size
+            )
+
+        val text = JsonUtils.toJsonLinesAsync(header, response.result)
+        CallToolResult(content = listOf(TextContent(text)))
     }
 }
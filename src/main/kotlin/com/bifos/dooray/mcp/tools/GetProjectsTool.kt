@@ -1,9 +1,9 @@
 package com.bifos.dooray.mcp.tools
 
 import com.bifos.dooray.mcp.client.DoorayClient
-import com.bifos.dooray.mcp.exception.ToolException
-import com.bifos.dooray.mcp.types.ToolSuccessResponse
+import com.bifos.dooray.mcp.types.ProjectListResponseHeader
 import com.bifos.dooray.mcp.utils.JsonUtils
+import com.bifos.dooray.mcp.utils.TtlCache
 import io.modelcontextprotocol.kotlin.sdk.CallToolRequest
 import io.modelcontextprotocol.kotlin.sdk.CallToolResult
 import io.modelcontextprotocol.kotlin.sdk.TextContent
@@ -12,11 +12,17 @@ import kotlinx.serialization.json.buildJsonObject
 import kotlinx.serialization.json.jsonPrimitive
 import kotlinx.serialization.json.put
 import kotlinx.serialization.json.putJsonObject
+import kotlin.time.Duration.Companion.seconds
+
+/** 프로젝트 목록 응답 캐시를 생성합니다. 프로젝트 목록은 며칠 단위로 바뀌므로 짧은 TTL 로도 반복 조회를 크게 줄일 수 있습니다. */
+fun createProjectsCache(): TtlCache<String, CallToolResult> = createReadCache(ttl = 60.seconds)
 
 fun getProjectsTool(): Tool {
     return Tool(
             name = "dooray_project_list_projects",
-            description = "두레이에서 접근 가능한 프로젝트 목록을 조회합니다. 다양한 필터 조건으로 원하는 프로젝트를 찾을 수 있습니다.",
+            description =
+                    "두레이에서 접근 가능한 프로젝트 목록을 조회합니다. 다양한 필터 조건으로 원하는 프로젝트를 찾을 수 있습니다. " +
+                            "응답은 JSON Lines 형식입니다 (첫 줄: 메타데이터, 이후 한 줄에 프로젝트 하나).",
             inputSchema =
                     Tool.Input(
                             properties =
@@ -63,65 +69,35 @@ fun getProjectsTool(): Tool {
 }
 
 fun getProjectsHandler(doorayClient: DoorayClient): suspend (CallToolRequest) -> CallToolResult {
-    return { request ->
-        try {
-            val page = request.arguments["page"]?.jsonPrimitive?.content?.toIntOrNull()
-            val size = request.arguments["size"]?.jsonPrimitive?.content?.toIntOrNull()
-            val type = request.arguments["type"]?.jsonPrimitive?.content
-            val scope = request.arguments["scope"]?.jsonPrimitive?.content
-            val state = request.arguments["state"]?.jsonPrimitive?.content
+    return runTool { request ->
+        val page = request.arguments["page"]?.jsonPrimitive?.content?.toIntOrNull()
+        val size = request.arguments["size"]?.jsonPrimitive?.content?.toIntOrNull()
+        val type = request.arguments["type"]?.jsonPrimitive?.content
+        val scope = request.arguments["scope"]?.jsonPrimitive?.content
+        val state = request.arguments["state"]?.jsonPrimitive?.content
 
-            val response = doorayClient.getProjects(page, size, type, scope, state)
+        val response = doorayClient.getProjects(page, size, type, scope, state)
 
-            if (response.header.isSuccessful) {
-                val successResponse =
-                        ToolSuccessResponse(
-                                data =
-                                        buildJsonObject {
-                                            put(
-                                                    "projects",
-                                                    JsonUtils.toJsonElement(response.result)
-                                            )
-                                            put("totalCount", response.totalCount)
-                                            put("currentPage", page ?: 0)
-                                            put("pageSize", size ?: 20)
-                                            put(
-                                                    "filters",
-                                                    buildJsonObject {
-                                                        type?.let { put("type", it) }
-                                                        scope?.let { put("scope", it) }
-                                                        state?.let { put("state", it) }
-                                                    }
-                                            )
-                                        },
-                                message =
-                                        "프로젝트 목록을 성공적으로 조회했습니다 (총 ${response.totalCount}개 중 ${response.result.size}개 조회)"
-                        )
+        if (!response.header.isSuccessful) {
+            return@runTool response.header.toApiErrorResult()
+        }
 
-                CallToolResult(
-                        content = listOf(TextContent(JsonUtils.toJsonString(successResponse)))
+        val header =
+                ProjectListResponseHeader(
+                        message =
+                                "프로젝트 목록을 성공적으로 조회했습니다 (총 ${response.totalCount}개 중 ${response.result.size}개 조회)",
+                        totalCount = response.totalCount,
+                        currentPage = page ?: 0,
+                        pageSize = size ?: 20,
+                        filters =
+                                buildMap {
+                                    type?.let { put("type", it) }
+                                    scope?.let { put("scope", it) }
+                                    state?.let { put("state", it) }
+                                }
                 )
-            } else {
-                val errorResponse =
-                        ToolException(
-                                        type = ToolException.API_ERROR,
-                                        message = response.header.resultMessage,
-                                        code = "DOORAY_API_${response.header.resultCode}"
-                                )
-                            .toErrorResponse()
 
-                CallToolResult(content = listOf(TextContent(JsonUtils.toJsonString(errorResponse))))
-            }
-        } catch (e: Exception) {
-            val errorResponse =
-                    ToolException(
-                                    type = ToolException.INTERNAL_ERROR,
-                                    message = "내부 오류가 발생했습니다: ${e.message}",
-                                    details = e.stackTraceToString()
-                            )
-                            .toErrorResponse()
-
-            CallToolResult(content = listOf(TextContent(JsonUtils.toJsonString(errorResponse))))
-        }
+        val text = JsonUtils.toJsonLinesAsync(header, response.result)
+        CallToolResult(content = listOf(TextContent(text)))
     }
 }
@@ -1,12 +1,8 @@
 package com.bifos.dooray.mcp.tools
 
 import com.bifos.dooray.mcp.client.DoorayClient
-import com.bifos.dooray.mcp.exception.ToolException
-import com.bifos.dooray.mcp.types.ToolSuccessResponse
-import com.bifos.dooray.mcp.utils.JsonUtils
 import io.modelcontextprotocol.kotlin.sdk.CallToolRequest
 import io.modelcontextprotocol.kotlin.sdk.CallToolResult
-import io.modelcontextprotocol.kotlin.sdk.TextContent
 import io.modelcontextprotocol.kotlin.sdk.Tool
 import kotlinx.serialization.json.buildJsonObject
 import kotlinx.serialization.json.jsonPrimitive
@@ -45,82 +41,29 @@ fun getWikiPageTool(): Tool {
 }
 
 fun getWikiPageHandler(doorayClient: DoorayClient): suspend (CallToolRequest) -> CallToolResult {
-    return { request ->
-        try {
-            val projectId = request.arguments["project_id"]?.jsonPrimitive?.content
-            val pageId = request.arguments["page_id"]?.jsonPrimitive?.content
-
-            when {
-                projectId == null -> {
-                    val errorResponse =
-                        ToolException(
-                            type = ToolException.PARAMETER_MISSING,
-                            message =
-                                "project_id 파라미터가 필요합니다. dooray_wiki_list_projects를 사용해서 프로젝트 ID를 먼저 조회하세요.",
-                            code = "MISSING_PROJECT_ID"
-                        )
-                            .toErrorResponse()
-
-                    CallToolResult(
-                        content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-                    )
-                }
-
-                pageId == null -> {
-                    val errorResponse =
-                        ToolException(
-                            type = ToolException.PARAMETER_MISSING,
-                            message =
-                                "page_id 파라미터가 필요합니다. dooray_wiki_list_pages를 사용해서 페이지 ID를 먼저 조회하세요.",
-                            code = "MISSING_PAGE_ID"
-                        )
-                            .toErrorResponse()
-
-                    CallToolResult(
-                        content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-                    )
-                }
-
-                else -> {
-                    val response = doorayClient.getWikiPage(projectId, pageId)
-
-                    if (response.header.isSuccessful) {
-                        val successResponse =
-                            ToolSuccessResponse(
-                                data = response.result,
-                                message =
-                                    "📖 위키 페이지 '${response.result.subject}'의 상세 정보를 성공적으로 조회했습니다"
-                            )
-
-                        CallToolResult(
-                            content =
-                                listOf(TextContent(JsonUtils.toJsonString(successResponse)))
-                        )
-                    } else {
-                        val errorResponse =
-                            ToolException(
-                                type = ToolException.API_ERROR,
-                                message = response.header.resultMessage,
-                                code = "DOORAY_API_${response.header.resultCode}"
-                            )
-                                .toErrorResponse()
-
-                        CallToolResult(
-                            content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-                        )
-                    }
-                }
-            }
-        } catch (e: Exception) {
-            val errorResponse =
-                ToolException(
-                    type = ToolException.INTERNAL_ERROR,
-                    message = "내부 오류가 발생했습니다: ${e.message}",
-                    details = e.stackTraceToString()
+    return runTool { request ->
+        val projectId =
+            request.arguments["project_id"]?.jsonPrimitive?.content
+                ?: return@runTool parameterMissing(
+                    "project_id 파라미터가 필요합니다. dooray_wiki_list_projects를 사용해서 프로젝트 ID를 먼저 조회하세요.",
+                    "MISSING_PROJECT_ID"
                 )
-                    .toErrorResponse()
+        val pageId =
+            request.arguments["page_id"]?.jsonPrimitive?.content
+                ?: return@runTool parameterMissing(
+                    "page_id 파라미터가 필요합니다. dooray_wiki_list_pages를 사용해서 페이지 ID를 먼저 조회하세요.",
+                    "MISSING_PAGE_ID"
+                )
+
+        val response = doorayClient.getWikiPage(projectId, pageId)
 
-            CallToolResult(content = listOf(TextContent(JsonUtils.toJsonString(errorResponse))))
+        if (!response.header.isSuccessful) {
+            return@runTool response.header.toApiErrorResult()
         }
+
+        toolSuccess(
+            data = response.result,
+            message = "📖 위키 페이지 '${response.result.subject}'의 상세 정보를 성공적으로 조회했습니다"
+        )
     }
 }
@@ -1,12 +1,8 @@
 package com.bifos.dooray.mcp.tools
 
 import com.bifos.dooray.mcp.client.DoorayClient
-import com.bifos.dooray.mcp.exception.ToolException
-import com.bifos.dooray.mcp.types.ToolSuccessResponse
-import com.bifos.dooray.mcp.utils.JsonUtils
 import io.modelcontextprotocol.kotlin.sdk.CallToolRequest
 import io.modelcontextprotocol.kotlin.sdk.CallToolResult
-import io.modelcontextprotocol.kotlin.sdk.TextContent
 import io.modelcontextprotocol.kotlin.sdk.Tool
 import kotlinx.serialization.json.buildJsonObject
 import kotlinx.serialization.json.jsonPrimitive
@@ -41,73 +37,31 @@ fun getWikiPagesTool(): Tool {
 }
 
 fun getWikiPagesHandler(doorayClient: DoorayClient): suspend (CallToolRequest) -> CallToolResult {
-    return { request ->
-        try {
-            val projectId = request.arguments["project_id"]?.jsonPrimitive?.content
-            val parentPageId = request.arguments["parent_page_id"]?.jsonPrimitive?.content
+    return runTool { request ->
+        val projectId =
+            request.arguments["project_id"]?.jsonPrimitive?.content
+                ?: return@runTool parameterMissing(
+                    "project_id 파라미터가 필요합니다. dooray_wiki_list_projects를 사용해서 프로젝트 ID를 먼저 조회하세요.",
+                    "MISSING_PROJECT_ID"
+                )
+        val parentPageId = request.arguments["parent_page_id"]?.jsonPrimitive?.content
 
-            when {
-                projectId == null -> {
-                    val errorResponse =
-                            ToolException(
-                                            type = ToolException.PARAMETER_MISSING,
-                                            message =
-                                                    "project_id 파라미터가 필요합니다. dooray_wiki_list_projects를 사용해서 프로젝트 ID를 먼저 조회하세요.",
-                                            code = "MISSING_PROJECT_ID"
-                                    )
-                                    .toErrorResponse()
-
-                    CallToolResult(
-                            content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-                    )
-                }
-                else -> {
-                    val response =
-                            if (parentPageId != null) {
-                                doorayClient.getWikiPages(projectId, parentPageId)
-                            } else {
-                                doorayClient.getWikiPages(projectId)
-                            }
-
-                    if (response.header.isSuccessful) {
-                        val messagePrefix =
-                                if (parentPageId != null) "📄 하위 위키 페이지" else "📚 루트 위키 페이지"
-                        val successResponse =
-                                ToolSuccessResponse(
-                                        data = response.result,
-                                        message =
-                                                "$messagePrefix 목록을 성공적으로 조회했습니다 (총 ${response.result.size}개)"
-                                )
-
-                        CallToolResult(
-                                content =
-                                        listOf(TextContent(JsonUtils.toJsonString(successResponse)))
-                        )
-                    } else {
-                        val errorResponse =
-                                ToolException(
-                                                type = ToolException.API_ERROR,
-                                                message = response.header.resultMessage,
-                                                code = "DOORAY_API_${response.header.resultCode}"
-                                        )
-                                        .toErrorResponse()
-
-                        CallToolResult(
-                                content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-                        )
-                    }
-                }
+        val response =
+            if (parentPageId != null) {
+                doorayClient.getWikiPages(projectId, parentPageId)
+            } else {
+                doorayClient.getWikiPages(projectId)
             }
-        } catch (e: Exception) {
-            val errorResponse =
-                    ToolException(
-                                    type = ToolException.INTERNAL_ERROR,
-                                    message = "내부 오류가 발생했습니다: ${e.message}",
-                                    details = e.stackTraceToString()
-                            )
-                            .toErrorResponse()
 
-            CallToolResult(content = listOf(TextContent(JsonUtils.toJsonString(errorResponse))))
+        if (!response.header.isSuccessful) {
+            return@runTool response.header.toApiErrorResult()
         }
+
+        val messagePrefix = if (parentPageId != null) "📄 하위 위키 페이지" else "📚 루트 위키 페이지"
+
+        toolSuccess(
+            data = response.result,
+            message = "$messagePrefix 목록을 성공적으로 조회했습니다 (총 ${response.result.size}개)"
+        )
     }
 }
@@ -1,12 +1,8 @@
 package com.bifos.dooray.mcp.tools
 
 import com.bifos.dooray.mcp.client.DoorayClient
-import com.bifos.dooray.mcp.exception.ToolException
-import com.bifos.dooray.mcp.types.ToolSuccessResponse
-import com.bifos.dooray.mcp.utils.JsonUtils
 import io.modelcontextprotocol.kotlin.sdk.CallToolRequest
 import io.modelcontextprotocol.kotlin.sdk.CallToolResult
-import io.modelcontextprotocol.kotlin.sdk.TextContent
 import io.modelcontextprotocol.kotlin.sdk.Tool
 import kotlinx.serialization.json.buildJsonObject
 import kotlinx.serialization.json.jsonPrimitive
@@ -39,57 +35,32 @@ fun getWikisTool(): Tool {
 }
 
 fun getWikisHandler(doorayClient: DoorayClient): suspend (CallToolRequest) -> CallToolResult {
-    return { request ->
-        try {
-            // 기본값 처리: page는 0, size는 200
-            val page = request.arguments["page"]?.jsonPrimitive?.content?.toIntOrNull() ?: 0
-            val size = request.arguments["size"]?.jsonPrimitive?.content?.toIntOrNull() ?: 200
+    return runTool { request ->
+        // 기본값 처리: page는 0, size는 200
+        val page = request.arguments["page"]?.jsonPrimitive?.content?.toIntOrNull() ?: 0
+        val size = request.arguments["size"]?.jsonPrimitive?.content?.toIntOrNull() ?: 200
 
-            val response = doorayClient.getWikis(page, size)
+        val response = doorayClient.getWikis(page, size)
 
-            if (response.header.isSuccessful) {
-                val pageInfo = if (page == 0) "첫 번째 페이지" else "${page + 1}번째 페이지"
-
-                // 다음 단계 제안 메시지
-                val nextStepHint =
-                    if (response.result.isNotEmpty()) {
-                        "\n\n💡 다음 단계: 특정 프로젝트의 위키 페이지들을 보려면 dooray_wiki_list_pages를 사용하세요."
-                    } else {
-                        if (page == 0) "\n\n📋 조회 결과가 없습니다. 접근 권한을 확인해주세요."
-                        else "\n\n📄 더 이상 프로젝트가 없습니다."
-                    }
+        if (!response.header.isSuccessful) {
+            return@runTool response.header.toApiErrorResult()
+        }
 
-                val successResponse =
-                    ToolSuccessResponse(
-                        data = response.result,
-                        message =
-                            "📚 두레이 위키 프로젝트 목록을 성공적으로 조회했습니다 ($pageInfo, 총 ${response.result.size}개)$nextStepHint"
-                    )
+        val pageInfo = if (page == 0) "첫 번째 페이지" else "${page + 1}번째 페이지"
 
-                CallToolResult(
-                    content = listOf(TextContent(JsonUtils.toJsonString(successResponse)))
-                )
+        // 다음 단계 제안 메시지
+        val nextStepHint =
+            if (response.result.isNotEmpty()) {
+                "\n\n💡 다음 단계: 특정 프로젝트의 위키 페이지들을 보려면 dooray_wiki_list_pages를 사용하세요."
             } else {
-                val errorResponse =
-                    ToolException(
-                        type = ToolException.API_ERROR,
-                        message = response.header.resultMessage,
-                        code = "DOORAY_API_${response.header.resultCode}"
-                    )
-                        .toErrorResponse()
-
-                CallToolResult(content = listOf(TextContent(JsonUtils.toJsonString(errorResponse))))
+                if (page == 0) "\n\n📋 조회 결과가 없습니다. 접근 권한을 확인해주세요."
+                else "\n\n📄 더 이상 프로젝트가 없습니다."
             }
-        } catch (e: Exception) {
-            val errorResponse =
-                ToolException(
-                    type = ToolException.INTERNAL_ERROR,
-                    message = "내부 오류가 발생했습니다: ${e.message}",
-                    details = e.stackTraceToString()
-                )
-                    .toErrorResponse()
 
-            CallToolResult(content = listOf(TextContent(JsonUtils.toJsonString(errorResponse))))
-        }
+        toolSuccess(
+            data = response.result,
+            message =
+                "📚 두레이 위키 프로젝트 목록을 성공적으로 조회했습니다 ($pageInfo, 총 ${response.result.size}개)$nextStepHint"
+        )
     }
 }
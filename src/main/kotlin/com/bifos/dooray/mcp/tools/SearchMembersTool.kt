@@ -83,31 +83,20 @@ fun searchMembersHandler(doorayClient: DoorayClient): suspend (CallToolRequest)
                     content = listOf(TextContent(JsonUtils.toJsonString(successResponse)))
                 )
             } else {
-                val errorResponse = ToolException(
+                ToolException(
                     type = ToolException.API_ERROR,
                     message = "멤버 검색 실패: ${response.header.resultMessage}",
                     code = "SEARCH_MEMBERS_FAILED"
-                ).toErrorResponse()
-                
-                CallToolResult(
-                    content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-                )
+                ).toCallToolResult()
             }
         } catch (e: ToolException) {
-            val errorResponse = e.toErrorResponse()
-            CallToolResult(
-                content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-            )
+            e.toCallToolResult()
         } catch (e: Exception) {
-            val errorResponse = ToolException(
+            ToolException(
                 type = ToolException.INTERNAL_ERROR,
                 message = "멤버 검색 중 오류가 발생했습니다: ${e.message}",
                 code = "SEARCH_MEMBERS_ERROR"
-            ).toErrorResponse()
-            
-            CallToolResult(
-                content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-            )
+            ).toCallToolResult()
         }
     }
 }
\ No newline at end of file
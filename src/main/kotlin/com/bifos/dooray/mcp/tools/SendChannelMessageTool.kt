@@ -12,6 +12,12 @@ import io.modelcontextprotocol.kotlin.sdk.TextContent
 import io.modelcontextprotocol.kotlin.sdk.Tool
 import kotlinx.serialization.json.*
 
+/** 두레이 멘션 형식: [@이름](dooray://...) */
+private val MENTION_REGEX = Regex("""\[@[^\]]+\]\(dooray://[^\)]+\)""")
+
+/** 멘션 직후에 붙는 "さん、" 호칭 */
+private val HONORIFIC_PREFIX_REGEX = Regex("""^\s*さん、?\s*""")
+
 fun sendChannelMessageTool(): Tool {
     return Tool(
         name = "dooray_messenger_send_channel_message",
@@ -76,26 +82,18 @@ fun sendChannelMessageHandler(doorayClient: DoorayClient): suspend (CallToolRequ
 
             when {
                 channelId == null -> {
-                    val errorResponse = ToolException(
+                    ToolException(
                         type = ToolException.PARAMETER_MISSING,
                         message = "channel_id 파라미터가 필요합니다.",
                         code = "MISSING_CHANNEL_ID"
-                    ).toErrorResponse()
-
-                    CallToolResult(
-                        content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-                    )
+                    ).toCallToolResult()
                 }
                 text == null -> {
-                    val errorResponse = ToolException(
+                    ToolException(
                         type = ToolException.PARAMETER_MISSING,
                         message = "text 파라미터가 필요합니다.",
                         code = "MISSING_TEXT"
-                    ).toErrorResponse()
-
-                    CallToolResult(
-                        content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-                    )
+                    ).toCallToolResult()
                 }
                 else -> {
                     // 멘션 기능 처리
@@ -107,8 +105,7 @@ fun sendChannelMessageHandler(doorayClient: DoorayClient): suspend (CallToolRequ
                     // Claude가 생성한 멘션 텍스트를 이상적인 형식으로 재구성
                     if (hasDoorayMention) {
                         // 멘션 패턴을 찾아서 분리
-                        val mentionRegex = Regex("""\[@[^\]]+\]\(dooray://[^\)]+\)""")
-                        val mentions = mentionRegex.findAll(finalText).map { it.value }.toList()
+                        val mentions = MENTION_REGEX.findAll(finalText).map { it.value }.toList()
                         
                         if (mentions.isNotEmpty()) {
                             // 멘션을 제거한 텍스트
@@ -118,7 +115,7 @@ fun sendChannelMessageHandler(doorayClient: DoorayClient): suspend (CallToolRequ
                             }
                             
                             // "さん、" 패턴 제거 (멘션 직후에 나오는 경우)
-                            cleanText = cleanText?.replace(Regex("""^\s*さん、?\s*"""), "") ?: ""
+                            cleanText = cleanText?.replace(HONORIFIC_PREFIX_REGEX, "") ?: ""
                             
                             // 멘션들을 첫 줄에, 그 다음 줄부터 메시지
                             finalText = mentions.joinToString("\n") + "\n" + cleanText
@@ -174,33 +171,22 @@ fun sendChannelMessageHandler(doorayClient: DoorayClient): suspend (CallToolRequ
                             content = listOf(TextContent(JsonUtils.toJsonString(successResponse)))
                         )
                     } else {
-                        val errorResponse = ToolException(
+                        ToolException(
                             type = ToolException.API_ERROR,
                             message = "채널 메시지 전송 실패: ${response.header.resultMessage}",
                             code = "SEND_CHANNEL_MESSAGE_FAILED"
-                        ).toErrorResponse()
-                        
-                        CallToolResult(
-                            content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-                        )
+                        ).toCallToolResult()
                     }
                 }
             }
         } catch (e: ToolException) {
-            val errorResponse = e.toErrorResponse()
-            CallToolResult(
-                content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-            )
+            e.toCallToolResult()
         } catch (e: Exception) {
-            val errorResponse = ToolException(
+            ToolException(
                 type = ToolException.INTERNAL_ERROR,
                 message = "채널 메시지 전송 중 오류가 발생했습니다: ${e.message}",
                 code = "SEND_CHANNEL_MESSAGE_ERROR"
-            ).toErrorResponse()
-            
-            CallToolResult(
-                content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-            )
+            ).toCallToolResult()
         }
     }
 }
\ No newline at end of file
@@ -45,26 +45,18 @@ fun sendDirectMessageHandler(doorayClient: DoorayClient): suspend (CallToolReque
 
             when {
                 organizationMemberId == null -> {
-                    val errorResponse = ToolException(
+                    ToolException(
                         type = ToolException.PARAMETER_MISSING,
                         message = "organization_member_id 파라미터가 필요합니다.",
                         code = "MISSING_ORGANIZATION_MEMBER_ID"
-                    ).toErrorResponse()
-
-                    CallToolResult(
-                        content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-                    )
+                    ).toCallToolResult()
                 }
                 text == null -> {
-                    val errorResponse = ToolException(
+                    ToolException(
                         type = ToolException.PARAMETER_MISSING,
                         message = "text 파라미터가 필요합니다.",
                         code = "MISSING_TEXT"
-                    ).toErrorResponse()
-
-                    CallToolResult(
-                        content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-                    )
+                    ).toCallToolResult()
                 }
                 else -> {
                     val directMessageRequest = DirectMessageRequest(
@@ -88,33 +80,22 @@ fun sendDirectMessageHandler(doorayClient: DoorayClient): suspend (CallToolReque
                             content = listOf(TextContent(JsonUtils.toJsonString(successResponse)))
                         )
                     } else {
-                        val errorResponse = ToolException(
+                        ToolException(
                             type = ToolException.API_ERROR,
                             message = "다이렉트 메시지 전송 실패: ${response.header.resultMessage}",
                             code = "SEND_DIRECT_MESSAGE_FAILED"
-                        ).toErrorResponse()
-                        
-                        CallToolResult(
-                            content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-                        )
+                        ).toCallToolResult()
                     }
                 }
             }
         } catch (e: ToolException) {
-            val errorResponse = e.toErrorResponse()
-            CallToolResult(
-                content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-            )
+            e.toCallToolResult()
         } catch (e: Exception) {
-            val errorResponse = ToolException(
+            ToolException(
                 type = ToolException.INTERNAL_ERROR,
                 message = "다이렉트 메시지 전송 중 오류가 발생했습니다: ${e.message}",
                 code = "SEND_DIRECT_MESSAGE_ERROR"
-            ).toErrorResponse()
-            
-            CallToolResult(
-                content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-            )
+            ).toCallToolResult()
         }
     }
 }
\ No newline at end of file
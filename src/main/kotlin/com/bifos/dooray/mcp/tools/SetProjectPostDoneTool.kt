@@ -1,12 +1,8 @@
 package com.bifos.dooray.mcp.tools
 
 import com.bifos.dooray.mcp.client.DoorayClient
-import com.bifos.dooray.mcp.exception.ToolException
-import com.bifos.dooray.mcp.types.ToolSuccessResponse
-import com.bifos.dooray.mcp.utils.JsonUtils
 import io.modelcontextprotocol.kotlin.sdk.CallToolRequest
 import io.modelcontextprotocol.kotlin.sdk.CallToolResult
-import io.modelcontextprotocol.kotlin.sdk.TextContent
 import io.modelcontextprotocol.kotlin.sdk.Tool
 import kotlinx.serialization.json.buildJsonObject
 import kotlinx.serialization.json.jsonPrimitive
@@ -44,85 +40,34 @@ fun setProjectPostDoneTool(): Tool {
 fun setProjectPostDoneHandler(
     doorayClient: DoorayClient
 ): suspend (CallToolRequest) -> CallToolResult {
-    return { request ->
-        try {
-            val projectId = request.arguments["project_id"]?.jsonPrimitive?.content
-            val postId = request.arguments["post_id"]?.jsonPrimitive?.content
-
-            when {
-                projectId == null -> {
-                    val errorResponse =
-                        ToolException(
-                            type = ToolException.PARAMETER_MISSING,
-                            message = "project_id 파라미터가 필요합니다. 프로젝트 ID를 입력하세요.",
-                            code = "MISSING_PROJECT_ID"
-                        )
-                            .toErrorResponse()
-
-                    CallToolResult(
-                        content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-                    )
-                }
-
-                postId == null -> {
-                    val errorResponse =
-                        ToolException(
-                            type = ToolException.PARAMETER_MISSING,
-                            message =
-                                "post_id 파라미터가 필요합니다. dooray_project_list_posts를 사용해서 업무 ID를 먼저 조회하세요.",
-                            code = "MISSING_POST_ID"
-                        )
-                            .toErrorResponse()
-
-                    CallToolResult(
-                        content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-                    )
-                }
-
-                else -> {
-                    val response = doorayClient.setPostDone(projectId, postId)
-
-                    if (response.header.isSuccessful) {
-                        val nextStepHint =
-                            "\n\n💡 다음 가능한 작업:\n" +
-                                    "- dooray_project_get_post: 완료된 업무 상태 확인\n" +
-                                    "- dooray_project_list_posts: 프로젝트 업무 목록 조회"
+    return runTool { request ->
+        val projectId =
+            request.arguments["project_id"]?.jsonPrimitive?.content
+                ?: return@runTool parameterMissing(
+                    "project_id 파라미터가 필요합니다. 프로젝트 ID를 입력하세요.",
+                    "MISSING_PROJECT_ID"
+                )
+        val postId =
+            request.arguments["post_id"]?.jsonPrimitive?.content
+                ?: return@runTool parameterMissing(
+                    "post_id 파라미터가 필요합니다. dooray_project_list_posts를 사용해서 업무 ID를 먼저 조회하세요.",
+                    "MISSING_POST_ID"
+                )
 
-                        val successResponse =
-                            ToolSuccessResponse(
-                                data = mapOf("message" to "업무가 성공적으로 완료 처리되었습니다."),
-                                message = "✅ 업무를 성공적으로 완료 처리했습니다$nextStepHint"
-                            )
+        val response = doorayClient.setPostDone(projectId, postId)
 
-                        CallToolResult(
-                            content =
-                                listOf(TextContent(JsonUtils.toJsonString(successResponse)))
-                        )
-                    } else {
-                        val errorResponse =
-                            ToolException(
-                                type = ToolException.API_ERROR,
-                                message = response.header.resultMessage,
-                                code = "DOORAY_API_${response.header.resultCode}"
-                            )
-                                .toErrorResponse()
+        if (!response.header.isSuccessful) {
+            return@runTool response.header.toApiErrorResult()
+        }
 
-                        CallToolResult(
-                            content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-                        )
-                    }
-                }
-            }
-        } catch (e: Exception) {
-            val errorResponse =
-                ToolException(
-                    type = ToolException.INTERNAL_ERROR,
-                    message = "내부 오류가 발생했습니다: ${e.message}",
-                    details = e.stackTraceToString()
-                )
-                    .toErrorResponse()
+        val nextStepHint =
+            "\n\n💡 다음 가능한 작업:\n" +
+                    "- dooray_project_get_post: 완료된 업무 상태 확인\n" +
+                    "- dooray_project_list_posts: 프로젝트 업무 목록 조회"
 
-            CallToolResult(content = listOf(TextContent(JsonUtils.toJsonString(errorResponse))))
-        }
+        toolSuccess(
+            data = mapOf("message" to "업무가 성공적으로 완료 처리되었습니다."),
+            message = "✅ 업무를 성공적으로 완료 처리했습니다$nextStepHint"
+        )
     }
 }
@@ -1,12 +1,8 @@
 package com.bifos.dooray.mcp.tools
 
 import com.bifos.dooray.mcp.client.DoorayClient
-import com.bifos.dooray.mcp.exception.ToolException
-import com.bifos.dooray.mcp.types.ToolSuccessResponse
-import com.bifos.dooray.mcp.utils.JsonUtils
 import io.modelcontextprotocol.kotlin.sdk.CallToolRequest
 import io.modelcontextprotocol.kotlin.sdk.CallToolResult
-import io.modelcontextprotocol.kotlin.sdk.TextContent
 import io.modelcontextprotocol.kotlin.sdk.Tool
 import kotlinx.serialization.json.buildJsonObject
 import kotlinx.serialization.json.jsonPrimitive
@@ -47,101 +43,40 @@ fun setProjectPostWorkflowTool(): Tool {
 fun setProjectPostWorkflowHandler(
     doorayClient: DoorayClient
 ): suspend (CallToolRequest) -> CallToolResult {
-    return { request ->
-        try {
-            val projectId = request.arguments["project_id"]?.jsonPrimitive?.content
-            val postId = request.arguments["post_id"]?.jsonPrimitive?.content
-            val workflowId = request.arguments["workflow_id"]?.jsonPrimitive?.content
-
-            when {
-                projectId == null -> {
-                    val errorResponse =
-                        ToolException(
-                            type = ToolException.PARAMETER_MISSING,
-                            message = "project_id 파라미터가 필요합니다. 프로젝트 ID를 입력하세요.",
-                            code = "MISSING_PROJECT_ID"
-                        )
-                            .toErrorResponse()
-
-                    CallToolResult(
-                        content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-                    )
-                }
-
-                postId == null -> {
-                    val errorResponse =
-                        ToolException(
-                            type = ToolException.PARAMETER_MISSING,
-                            message =
-                                "post_id 파라미터가 필요합니다. dooray_project_list_posts를 사용해서 업무 ID를 먼저 조회하세요.",
-                            code = "MISSING_POST_ID"
-                        )
-                            .toErrorResponse()
-
-                    CallToolResult(
-                        content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-                    )
-                }
-
-                workflowId == null -> {
-                    val errorResponse =
-                        ToolException(
-                            type = ToolException.PARAMETER_MISSING,
-                            message =
-                                "workflow_id 파라미터가 필요합니다. 변경할 워크플로우 ID를 입력하세요.",
-                            code = "MISSING_WORKFLOW_ID"
-                        )
-                            .toErrorResponse()
-
-                    CallToolResult(
-                        content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-                    )
-                }
-
-                else -> {
-                    val response = doorayClient.setPostWorkflow(projectId, postId, workflowId)
-
-                    if (response.header.isSuccessful) {
-                        val nextStepHint =
-                            "\n\n💡 다음 가능한 작업:\n" +
-                                    "- dooray_project_get_post: 변경된 업무 상태 확인\n" +
-                                    "- dooray_project_set_post_done: 업무 완료 처리 (완료 상태로 변경)"
+    return runTool { request ->
+        val projectId =
+            request.arguments["project_id"]?.jsonPrimitive?.content
+                ?: return@runTool parameterMissing(
+                    "project_id 파라미터가 필요합니다. 프로젝트 ID를 입력하세요.",
+                    "MISSING_PROJECT_ID"
+                )
+        val postId =
+            request.arguments["post_id"]?.jsonPrimitive?.content
+                ?: return@runTool parameterMissing(
+                    "post_id 파라미터가 필요합니다. dooray_project_list_posts를 사용해서 업무 ID를 먼저 조회하세요.",
+                    "MISSING_POST_ID"
+                )
+        val workflowId =
+            request.arguments["workflow_id"]?.jsonPrimitive?.content
+                ?: return@runTool parameterMissing(
+                    "workflow_id 파라미터가 필요합니다. 변경할 워크플로우 ID를 입력하세요.",
+                    "MISSING_WORKFLOW_ID"
+                )
 
-                        val successResponse =
-                            ToolSuccessResponse(
-                                data = mapOf("message" to "워크플로우가 성공적으로 변경되었습니다."),
-                                message = "✅ 업무 상태를 성공적으로 변경했습니다$nextStepHint"
-                            )
+        val response = doorayClient.setPostWorkflow(projectId, postId, workflowId)
 
-                        CallToolResult(
-                            content =
-                                listOf(TextContent(JsonUtils.toJsonString(successResponse)))
-                        )
-                    } else {
-                        val errorResponse =
-                            ToolException(
-                                type = ToolException.API_ERROR,
-                                message = response.header.resultMessage,
-                                code = "DOORAY_API_${response.header.resultCode}"
-                            )
-                                .toErrorResponse()
+        if (!response.header.isSuccessful) {
+            return@runTool response.header.toApiErrorResult()
+        }
 
-                        CallToolResult(
-                            content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-                        )
-                    }
-                }
-            }
-        } catch (e: Exception) {
-            val errorResponse =
-                ToolException(
-                    type = ToolException.INTERNAL_ERROR,
-                    message = "내부 오류가 발생했습니다: ${e.message}",
-                    details = e.stackTraceToString()
-                )
-                    .toErrorResponse()
+        val nextStepHint =
+            "\n\n💡 다음 가능한 작업:\n" +
+                    "- dooray_project_get_post: 변경된 업무 상태 확인\n" +
+                    "- dooray_project_set_post_done: 업무 완료 처리 (완료 상태로 변경)"
 
-            CallToolResult(content = listOf(TextContent(JsonUtils.toJsonString(errorResponse))))
-        }
+        toolSuccess(
+            data = mapOf("message" to "워크플로우가 성공적으로 변경되었습니다."),
+            message = "✅ 업무 상태를 성공적으로 변경했습니다$nextStepHint"
+        )
     }
 }
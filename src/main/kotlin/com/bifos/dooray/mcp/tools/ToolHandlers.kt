@@ -0,0 +1,112 @@
+package com.bifos.dooray.mcp.tools
+
+import com.bifos.dooray.mcp.exception.ToolException
+import com.bifos.dooray.mcp.types.DoorayApiHeader
+import com.bifos.dooray.mcp.types.ToolSuccessResponse
+import com.bifos.dooray.mcp.utils.JsonUtils
+import com.bifos.dooray.mcp.utils.SingleFlight
+import com.bifos.dooray.mcp.utils.TtlCache
+import io.modelcontextprotocol.kotlin.sdk.CallToolRequest
+import io.modelcontextprotocol.kotlin.sdk.CallToolResult
+import io.modelcontextprotocol.kotlin.sdk.TextContent
+import kotlinx.coroutines.CancellationException
+import kotlinx.serialization.json.JsonObject
+import kotlin.time.Duration
+import kotlin.time.Duration.Companion.seconds
+
+/**
+ * 도구 핸들러 본문을 공통 예외 처리로 감쌉니다.
+ * 본문에서 던진 ToolException 은 그대로, 그 외 예외는 INTERNAL_ERROR 에러 응답으로 변환합니다.
+ */
+fun runTool(
+    block: suspend (CallToolRequest) -> CallToolResult
+): suspend (CallToolRequest) -> CallToolResult {
+    return { request ->
+        try {
+            block(request)
+        } catch (e: CancellationException) {
+            throw e
+        } catch (e: ToolException) {
+            e.toCallToolResult()
+        } catch (e: Exception) {
+            ToolException(
+                type = ToolException.INTERNAL_ERROR,
+                message = "내부 오류가 발생했습니다: ${e.message}",
+                details = e.stackTraceToString()
+            )
+                .toCallToolResult()
+        }
+    }
+}
+
+/** 성공 응답(ToolSuccessResponse)을 JSON 텍스트로 담은 결과를 만듭니다. */
+inline fun <reified T> toolSuccess(data: T, message: String? = null): CallToolResult {
+    val successResponse = ToolSuccessResponse(data = data, message = message)
+    return CallToolResult(content = listOf(TextContent(JsonUtils.toJsonString(successResponse))))
+}
+
+/** 필수 파라미터 누락 에러 결과를 만듭니다. */
+fun parameterMissing(message: String, code: String): CallToolResult {
+    return ToolException(type = ToolException.PARAMETER_MISSING, message = message, code = code)
+        .toCallToolResult()
+}
+
+/** 실패한 두레이 API 응답 헤더를 API_ERROR 에러 결과로 변환합니다. */
+fun DoorayApiHeader.toApiErrorResult(): CallToolResult {
+    return ToolException(
+        type = ToolException.API_ERROR,
+        message = resultMessage,
+        code = "DOORAY_API_${resultCode}"
+    )
+        .toCallToolResult()
+}
+
+/** 에러 응답을 isError 가 표시된 결과로 변환합니다. */
+fun ToolException.toCallToolResult(): CallToolResult {
+    return CallToolResult(
+        content = listOf(TextContent(JsonUtils.toJsonString(toErrorResponse()))),
+        isError = true
+    )
+}
+
+/** 조회 도구들이 공유하는 응답 캐시를 생성합니다 (기본 30초 TTL). */
+fun createReadCache(ttl: Duration = 30.seconds): TtlCache<String, CallToolResult> =
+    TtlCache(maxSize = 256, ttl = ttl)
+
+/**
+ * 멱등한 조회(GET) 도구 핸들러를 감싸 같은 인자의 호출에는 캐시된 결과를 반환합니다.
+ * 캐시 키는 도구 이름 + 이름순으로 정렬한 인자이며, 에러 응답(isError)은 캐싱하지 않습니다.
+ * 캐시에 없는 같은 인자의 호출이 동시에 들어오면 API 는 한 번만 호출하고 결과를 함께 사용합니다.
+ * 조회 도중 변경 도구가 캐시를 비웠다면 그 결과는 저장하지 않고, 이후의 조회는 무효화 이전 호출에 합류하지 않습니다.
+ */
+fun cachedGet(
+    toolName: String,
+    cache: TtlCache<String, CallToolResult>,
+    handler: suspend (CallToolRequest) -> CallToolResult
+): suspend (CallToolRequest) -> CallToolResult {
+    val inFlight = SingleFlight<Pair<Long, String>, CallToolResult>()
+    return { request ->
+        val key = cacheKey(toolName, request.arguments)
+        val generation = cache.generation
+        cache.get(key)
+            ?: inFlight.execute(generation to key) {
+                handler(request).also { result ->
+                    if (result.isError != true) cache.put(key, result, generation)
+                }
+            }
+    }
+}
+
+/** 변경 도구 핸들러를 감싸 실행 후 조회 캐시를 비웁니다. 방금 수정한 내용이 캐시 때문에 이전 상태로 보이지 않도록 합니다. */
+fun invalidatesCache(
+    cache: TtlCache<String, CallToolResult>,
+    handler: suspend (CallToolRequest) -> CallToolResult
+): suspend (CallToolRequest) -> CallToolResult {
+    return { request -> handler(request).also { cache.clear() } }
+}
+
+private fun cacheKey(toolName: String, arguments: JsonObject): String {
+    return arguments.entries
+        .sortedBy { it.key }
+        .joinToString(separator = "&", prefix = "$toolName?") { "${it.key}=${it.value}" }
+}
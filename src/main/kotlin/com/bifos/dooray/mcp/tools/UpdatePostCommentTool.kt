@@ -1,14 +1,10 @@
 package com.bifos.dooray.mcp.tools
 
 import com.bifos.dooray.mcp.client.DoorayClient
-import com.bifos.dooray.mcp.exception.ToolException
 import com.bifos.dooray.mcp.types.PostCommentBody
-import com.bifos.dooray.mcp.types.ToolSuccessResponse
 import com.bifos.dooray.mcp.types.UpdateCommentRequest
-import com.bifos.dooray.mcp.utils.JsonUtils
 import io.modelcontextprotocol.kotlin.sdk.CallToolRequest
 import io.modelcontextprotocol.kotlin.sdk.CallToolResult
-import io.modelcontextprotocol.kotlin.sdk.TextContent
 import io.modelcontextprotocol.kotlin.sdk.Tool
 import kotlinx.serialization.json.buildJsonObject
 import kotlinx.serialization.json.jsonPrimitive
@@ -67,106 +63,39 @@ fun updatePostCommentTool(): Tool {
 fun updatePostCommentHandler(
         doorayClient: DoorayClient
 ): suspend (CallToolRequest) -> CallToolResult {
-    return handler@{ request ->
-        try {
-            val projectId = request.arguments["project_id"]?.jsonPrimitive?.content
-            val postId = request.arguments["post_id"]?.jsonPrimitive?.content
-            val logId = request.arguments["log_id"]?.jsonPrimitive?.content
-            val content = request.arguments["content"]?.jsonPrimitive?.content
-            val mimeType =
-                    request.arguments["mime_type"]?.jsonPrimitive?.content ?: "text/x-markdown"
-
-            if (projectId.isNullOrBlank()) {
-                val errorResponse =
-                        ToolException(
-                                        type = ToolException.PARAMETER_MISSING,
-                                        message = "project_id 파라미터가 필요합니다.",
-                                        code = "MISSING_PROJECT_ID"
-                                )
-                                .toErrorResponse()
-
-                return@handler CallToolResult(
-                        content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-                )
-            }
-
-            if (postId.isNullOrBlank()) {
-                val errorResponse =
-                        ToolException(
-                                        type = ToolException.PARAMETER_MISSING,
-                                        message = "post_id 파라미터가 필요합니다.",
-                                        code = "MISSING_POST_ID"
-                                )
-                                .toErrorResponse()
-
-                return@handler CallToolResult(
-                        content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-                )
-            }
-
-            if (logId.isNullOrBlank()) {
-                val errorResponse =
-                        ToolException(
-                                        type = ToolException.PARAMETER_MISSING,
-                                        message = "log_id 파라미터가 필요합니다.",
-                                        code = "MISSING_LOG_ID"
-                                )
-                                .toErrorResponse()
-
-                return@handler CallToolResult(
-                        content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-                )
-            }
-
-            if (content.isNullOrBlank()) {
-                val errorResponse =
-                        ToolException(
-                                        type = ToolException.PARAMETER_MISSING,
-                                        message = "content 파라미터가 필요합니다.",
-                                        code = "MISSING_CONTENT"
-                                )
-                                .toErrorResponse()
-
-                return@handler CallToolResult(
-                        content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-                )
-            }
+    return runTool { request ->
+        val projectId = request.arguments["project_id"]?.jsonPrimitive?.content
+        val postId = request.arguments["post_id"]?.jsonPrimitive?.content
+        val logId = request.arguments["log_id"]?.jsonPrimitive?.content
+        val content = request.arguments["content"]?.jsonPrimitive?.content
+        val mimeType =
+                request.arguments["mime_type"]?.jsonPrimitive?.content ?: "text/x-markdown"
+
+        if (projectId.isNullOrBlank()) {
+            return@runTool parameterMissing("project_id 파라미터가 필요합니다.", "MISSING_PROJECT_ID")
+        }
 
-            val updateRequest =
-                    UpdateCommentRequest(
-                            body = PostCommentBody(mimeType = mimeType, content = content)
-                    )
+        if (postId.isNullOrBlank()) {
+            return@runTool parameterMissing("post_id 파라미터가 필요합니다.", "MISSING_POST_ID")
+        }
 
-            val response = doorayClient.updatePostComment(projectId, postId, logId, updateRequest)
+        if (logId.isNullOrBlank()) {
+            return@runTool parameterMissing("log_id 파라미터가 필요합니다.", "MISSING_LOG_ID")
+        }
 
-            if (response.header.isSuccessful) {
-                val successResponse =
-                        ToolSuccessResponse(data = null, message = "업무 댓글이 성공적으로 수정되었습니다.")
+        if (content.isNullOrBlank()) {
+            return@runTool parameterMissing("content 파라미터가 필요합니다.", "MISSING_CONTENT")
+        }
 
-                CallToolResult(
-                        content = listOf(TextContent(JsonUtils.toJsonString(successResponse)))
-                )
-            } else {
-                val errorResponse =
-                        ToolException(
-                                        type = ToolException.API_ERROR,
-                                        message = response.header.resultMessage,
-                                        code = "DOORAY_API_${response.header.resultCode}"
-                                )
-                                .toErrorResponse()
+        val updateRequest =
+                UpdateCommentRequest(body = PostCommentBody(mimeType = mimeType, content = content))
 
-                CallToolResult(content = listOf(TextContent(JsonUtils.toJsonString(errorResponse))))
-            }
-        } catch (e: Exception) {
-            val errorResponse =
-                    ToolException(
-                                    type = ToolException.INTERNAL_ERROR,
-                                    message = "내부 오류가 발생했습니다: ${e.message}",
-                                    details = e.stackTraceToString()
-                            )
-                            .toErrorResponse()
+        val response = doorayClient.updatePostComment(projectId, postId, logId, updateRequest)
 
-            CallToolResult(content = listOf(TextContent(JsonUtils.toJsonString(errorResponse))))
+        if (!response.header.isSuccessful) {
+            return@runTool response.header.toApiErrorResult()
         }
+
+        toolSuccess(data = null, message = "업무 댓글이 성공적으로 수정되었습니다.")
     }
 }
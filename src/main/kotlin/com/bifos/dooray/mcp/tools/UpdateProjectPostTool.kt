@@ -3,10 +3,8 @@ package com.bifos.dooray.mcp.tools
 import com.bifos.dooray.mcp.client.DoorayClient
 import com.bifos.dooray.mcp.exception.ToolException
 import com.bifos.dooray.mcp.types.*
-import com.bifos.dooray.mcp.utils.JsonUtils
 import io.modelcontextprotocol.kotlin.sdk.CallToolRequest
 import io.modelcontextprotocol.kotlin.sdk.CallToolResult
-import io.modelcontextprotocol.kotlin.sdk.TextContent
 import io.modelcontextprotocol.kotlin.sdk.Tool
 import kotlinx.serialization.json.*
 
@@ -84,169 +82,118 @@ fun updateProjectPostTool(): Tool {
 fun updateProjectPostHandler(
     doorayClient: DoorayClient
 ): suspend (CallToolRequest) -> CallToolResult {
-    return handler@{ request ->
-        try {
-            val projectId = request.arguments["project_id"]?.jsonPrimitive?.content
-            val postId = request.arguments["post_id"]?.jsonPrimitive?.content
-
-            if (projectId.isNullOrBlank()) {
-                val errorResponse =
-                    ToolException(
-                        type = ToolException.PARAMETER_MISSING,
-                        message = "project_id 파라미터가 필요합니다.",
-                        code = "MISSING_PROJECT_ID"
-                    )
-                        .toErrorResponse()
-
-                return@handler CallToolResult(
-                    content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-                )
-            }
+    return runTool { request ->
+        val projectId = request.arguments["project_id"]?.jsonPrimitive?.content
+        val postId = request.arguments["post_id"]?.jsonPrimitive?.content
+
+        if (projectId.isNullOrBlank()) {
+            return@runTool parameterMissing("project_id 파라미터가 필요합니다.", "MISSING_PROJECT_ID")
+        }
+
+        if (postId.isNullOrBlank()) {
+            return@runTool parameterMissing("post_id 파라미터가 필요합니다.", "MISSING_POST_ID")
+        }
 
-            if (postId.isNullOrBlank()) {
-                val errorResponse =
-                    ToolException(
-                        type = ToolException.PARAMETER_MISSING,
-                        message = "post_id 파라미터가 필요합니다.",
-                        code = "MISSING_POST_ID"
-                    )
-                        .toErrorResponse()
-
-                return@handler CallToolResult(
-                    content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-                )
+        // 기존 업무 정보 조회
+        val existingPostResponse = doorayClient.getPost(projectId, postId)
+        if (!existingPostResponse.header.isSuccessful) {
+            return@runTool ToolException(
+                type = ToolException.API_ERROR,
+                message =
+                    "기존 업무 정보를 조회할 수 없습니다: ${existingPostResponse.header.resultMessage}",
+                code = "DOORAY_API_${existingPostResponse.header.resultCode}"
+            )
+                .toCallToolResult()
+        }
+
+        val existingPost = existingPostResponse.result
+
+        // 선택적 파라미터들 처리
+        val subject =
+            request.arguments["subject"]?.jsonPrimitive?.content ?: existingPost.subject
+        val bodyContent = request.arguments["body"]?.jsonPrimitive?.content
+        val body =
+            if (bodyContent != null) {
+                PostBody(mimeType = "text/x-markdown", content = bodyContent)
+            } else {
+                existingPost.body
+            }
+        val priority =
+            request.arguments["priority"]?.jsonPrimitive?.content ?: existingPost.priority
+        val milestoneId =
+            request.arguments["milestone_id"]?.jsonPrimitive?.content
+                ?: existingPost.milestone?.id
+        val dueDate =
+            request.arguments["due_date"]?.jsonPrimitive?.content ?: existingPost.dueDate
+
+        // 담당자와 참조자 처리
+        val toMemberIds =
+            request.arguments["to_member_ids"]?.jsonArray?.mapNotNull {
+                it.jsonPrimitive.content
             }
 
-            // 기존 업무 정보 조회
-            val existingPostResponse = doorayClient.getPost(projectId, postId)
-            if (!existingPostResponse.header.isSuccessful) {
-                val errorResponse =
-                    ToolException(
-                        type = ToolException.API_ERROR,
-                        message =
-                            "기존 업무 정보를 조회할 수 없습니다: ${existingPostResponse.header.resultMessage}",
-                        code =
-                            "DOORAY_API_${existingPostResponse.header.resultCode}"
-                    )
-                        .toErrorResponse()
-
-                return@handler CallToolResult(
-                    content = listOf(TextContent(JsonUtils.toJsonString(errorResponse)))
-                )
+        val ccMemberIds =
+            request.arguments["cc_member_ids"]?.jsonArray?.mapNotNull {
+                it.jsonPrimitive.content
             }
 
-            val existingPost = existingPostResponse.result
-
-            // 선택적 파라미터들 처리
-            val subject =
-                request.arguments["subject"]?.jsonPrimitive?.content ?: existingPost.subject
-            val bodyContent = request.arguments["body"]?.jsonPrimitive?.content
-            val body =
-                if (bodyContent != null) {
-                    PostBody(mimeType = "text/x-markdown", content = bodyContent)
-                } else {
-                    existingPost.body
-                }
-            val priority =
-                request.arguments["priority"]?.jsonPrimitive?.content ?: existingPost.priority
-            val milestoneId =
-                request.arguments["milestone_id"]?.jsonPrimitive?.content
-                    ?: existingPost.milestone?.id
-            val dueDate =
-                request.arguments["due_date"]?.jsonPrimitive?.content ?: existingPost.dueDate
-
-            // 담당자와 참조자 처리
-            val toMemberIds =
-                request.arguments["to_member_ids"]?.jsonArray?.mapNotNull {
-                    it.jsonPrimitive.content
-                }
-
-            val ccMemberIds =
-                request.arguments["cc_member_ids"]?.jsonArray?.mapNotNull {
-                    it.jsonPrimitive.content
-                }
-
-            val tagIds =
-                request.arguments["tag_ids"]?.jsonArray?.mapNotNull { it.jsonPrimitive.content }
-                    ?: existingPost.tags.map { it.id }
-
-            // 사용자 정보 구성
-            val users =
-                CreatePostUsers(
-                    to =
-                        if (toMemberIds != null) {
-                            toMemberIds.map {
-                                CreatePostUser(type = "member", member = Member(it))
-                            }
-                        } else {
-                            existingPost.users.to.mapNotNull { postUser ->
-                                postUser.member?.let { member ->
-                                    CreatePostUser(
-                                        type = "member",
-                                        member = Member(member.organizationMemberId)
-                                    )
-                                }
-                            }
-                        },
-                    cc =
-                        if (ccMemberIds != null) {
-                            ccMemberIds.map {
-                                CreatePostUser(type = "member", member = Member(it))
+        val tagIds =
+            request.arguments["tag_ids"]?.jsonArray?.mapNotNull { it.jsonPrimitive.content }
+                ?: existingPost.tags.map { it.id }
+
+        // 사용자 정보 구성
+        val users =
+            CreatePostUsers(
+                to =
+                    if (toMemberIds != null) {
+                        toMemberIds.map {
+                            CreatePostUser(type = "member", member = Member(it))
+                        }
+                    } else {
+                        existingPost.users.to.mapNotNull { postUser ->
+                            postUser.member?.let { member ->
+                                CreatePostUser(
+                                    type = "member",
+                                    member = Member(member.organizationMemberId)
+                                )
                             }
-                        } else {
-                            existingPost.users.cc.mapNotNull { postUser ->
-                                postUser.member?.let { member ->
-                                    CreatePostUser(
-                                        type = "member",
-                                        member = Member(member.organizationMemberId)
-                                    )
-                                }
+                        }
+                    },
+                cc =
+                    if (ccMemberIds != null) {
+                        ccMemberIds.map {
+                            CreatePostUser(type = "member", member = Member(it))
+                        }
+                    } else {
+                        existingPost.users.cc.mapNotNull { postUser ->
+                            postUser.member?.let { member ->
+                                CreatePostUser(
+                                    type = "member",
+                                    member = Member(member.organizationMemberId)
+                                )
                             }
                         }
-                )
-
-            // 업데이트 요청 객체 생성
-            val updateRequest =
-                UpdatePostRequest(
-                    users = users,
-                    subject = subject,
-                    body = body,
-                    priority = priority,
-                    milestoneId = milestoneId,
-                    dueDate = dueDate,
-                    tagIds = tagIds
-                )
-
-            val response = doorayClient.updatePost(projectId, postId, updateRequest)
-
-            if (response.header.isSuccessful) {
-                val successResponse =
-                    ToolSuccessResponse(data = null, message = "업무가 성공적으로 수정되었습니다.")
-
-                CallToolResult(
-                    content = listOf(TextContent(JsonUtils.toJsonString(successResponse)))
-                )
-            } else {
-                val errorResponse =
-                    ToolException(
-                        type = ToolException.API_ERROR,
-                        message = response.header.resultMessage,
-                        code = "DOORAY_API_${response.header.resultCode}"
-                    )
-                        .toErrorResponse()
-
-                CallToolResult(content = listOf(TextContent(JsonUtils.toJsonString(errorResponse))))
-            }
-        } catch (e: Exception) {
-            val errorResponse =
-                ToolException(
-                    type = ToolException.INTERNAL_ERROR,
-                    message = "내부 오류가 발생했습니다: ${e.message}",
-                    details = e.stackTraceToString()
-                )
-                    .toErrorResponse()
-
-            CallToolResult(content = listOf(TextContent(JsonUtils.toJsonString(errorResponse))))
+                    }
+            )
+
+        // 업데이트 요청 객체 생성
+        val updateRequest =
+            UpdatePostRequest(
+                users = users,
+                subject = subject,
+                body = body,
+                priority = priority,
+                milestoneId = milestoneId,
+                dueDate = dueDate,
+                tagIds = tagIds
+            )
+
+        val response = doorayClient.updatePost(projectId, postId, updateRequest)
+
+        if (!response.header.isSuccessful) {
+            return@runTool response.header.toApiErrorResult()
         }
+
+        toolSuccess(data = null, message = "업무가 성공적으로 수정되었습니다.")
     }
 }
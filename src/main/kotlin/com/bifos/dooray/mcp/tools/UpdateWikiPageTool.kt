@@ -3,10 +3,8 @@ package com.bifos.dooray.mcp.tools
 import com.bifos.dooray.mcp.client.DoorayClient
 import com.bifos.dooray.mcp.exception.ToolException
 import com.bifos.dooray.mcp.types.*
-import com.bifos.dooray.mcp.utils.JsonUtils
 import io.modelcontextprotocol.kotlin.sdk.CallToolRequest
 import io.modelcontextprotocol.kotlin.sdk.CallToolResult
-import io.modelcontextprotocol.kotlin.sdk.TextContent
 import io.modelcontextprotocol.kotlin.sdk.Tool
 import kotlinx.serialization.json.*
 
@@ -69,26 +67,9 @@ data class UpdateWikiPageParams(
 )
 
 fun updateWikiPageHandler(doorayClient: DoorayClient): suspend (CallToolRequest) -> CallToolResult {
-    return { request ->
-        try {
-            val validationResult = validateUpdateWikiPageParams(request)
-            if (validationResult != null) {
-                validationResult
-            } else {
-                val params = extractUpdateWikiPageParams(request)
-                performUpdateWikiPage(doorayClient, params)
-            }
-        } catch (e: Exception) {
-            val errorResponse =
-                ToolException(
-                    type = ToolException.INTERNAL_ERROR,
-                    message = "내부 오류가 발생했습니다: ${e.message}",
-                    details = e.stackTraceToString()
-                )
-                    .toErrorResponse()
-
-            CallToolResult(content = listOf(TextContent(JsonUtils.toJsonString(errorResponse))))
-        }
+    return runTool { request ->
+        validateUpdateWikiPageParams(request)
+            ?: performUpdateWikiPage(doorayClient, extractUpdateWikiPageParams(request))
     }
 }
 
@@ -102,44 +83,26 @@ private fun validateUpdateWikiPageParams(request: CallToolRequest): CallToolResu
         request.arguments["referrer_member_ids"]?.jsonArray?.map { it.jsonPrimitive.content }
 
     return when {
-        wikiId == null -> {
-            val errorResponse =
-                ToolException(
-                    type = ToolException.PARAMETER_MISSING,
-                    message =
-                        "wiki_id 파라미터가 필요합니다. dooray_wiki_list_projects를 사용해서 위키 ID를 먼저 조회하세요.",
-                    code = "MISSING_WIKI_ID"
-                )
-                    .toErrorResponse()
-
-            CallToolResult(content = listOf(TextContent(JsonUtils.toJsonString(errorResponse))))
-        }
+        wikiId == null ->
+            parameterMissing(
+                "wiki_id 파라미터가 필요합니다. dooray_wiki_list_projects를 사용해서 위키 ID를 먼저 조회하세요.",
+                "MISSING_WIKI_ID"
+            )
 
-        pageId == null -> {
-            val errorResponse =
-                ToolException(
-                    type = ToolException.PARAMETER_MISSING,
-                    message =
-                        "page_id 파라미터가 필요합니다. dooray_wiki_list_pages를 사용해서 페이지 ID를 먼저 조회하세요.",
-                    code = "MISSING_PAGE_ID"
-                )
-                    .toErrorResponse()
-
-            CallToolResult(content = listOf(TextContent(JsonUtils.toJsonString(errorResponse))))
-        }
+        pageId == null ->
+            parameterMissing(
+                "page_id 파라미터가 필요합니다. dooray_wiki_list_pages를 사용해서 페이지 ID를 먼저 조회하세요.",
+                "MISSING_PAGE_ID"
+            )
 
-        newSubject == null && newBodyContent == null && referrerMemberIds == null -> {
-            val errorResponse =
-                ToolException(
-                    type = ToolException.VALIDATION_ERROR,
-                    message =
-                        "수정할 내용이 없습니다. subject, body, referrer_member_ids 중 적어도 하나는 제공해야 합니다.",
-                    code = "NO_UPDATE_CONTENT"
-                )
-                    .toErrorResponse()
-
-            CallToolResult(content = listOf(TextContent(JsonUtils.toJsonString(errorResponse))))
-        }
+        newSubject == null && newBodyContent == null && referrerMemberIds == null ->
+            ToolException(
+                type = ToolException.VALIDATION_ERROR,
+                message =
+                    "수정할 내용이 없습니다. subject, body, referrer_member_ids 중 적어도 하나는 제공해야 합니다.",
+                code = "NO_UPDATE_CONTENT"
+            )
+                .toCallToolResult()
 
         else -> null // 검증 통과
     }
@@ -172,16 +135,13 @@ private suspend fun performUpdateWikiPage(
     val currentPageResponse = doorayClient.getWikiPage(params.wikiId, params.pageId)
 
     if (!currentPageResponse.header.isSuccessful) {
-        val errorResponse =
-            ToolException(
-                type = ToolException.API_ERROR,
-                message =
-                    "기존 위키 페이지를 조회할 수 없습니다: ${currentPageResponse.header.resultMessage}",
-                code = "DOORAY_API_${currentPageResponse.header.resultCode}"
-            )
-                .toErrorResponse()
-
-        return CallToolResult(content = listOf(TextContent(JsonUtils.toJsonString(errorResponse))))
+        return ToolException(
+            type = ToolException.API_ERROR,
+            message =
+                "기존 위키 페이지를 조회할 수 없습니다: ${currentPageResponse.header.resultMessage}",
+            code = "DOORAY_API_${currentPageResponse.header.resultCode}"
+        )
+            .toCallToolResult()
     }
 
     val currentPage = currentPageResponse.result
@@ -213,39 +173,28 @@ private suspend fun performUpdateWikiPage(
     // 5. 업데이트 요청 전송
     val response = doorayClient.updateWikiPage(params.wikiId, params.pageId, updateRequest)
 
-    return if (response.header.isSuccessful) {
-        val updateParts = mutableListOf<String>()
-        if (params.newSubject != null) updateParts.add("제목")
-        if (params.newBodyContent != null) updateParts.add("내용")
-        if (params.referrerMemberIds != null) updateParts.add("참조자")
-
-        val updatedFields = updateParts.joinToString(", ")
-
-        val successResponse =
-            ToolSuccessResponse(
-                data =
-                    buildJsonObject {
-                        put("wiki_id", params.wikiId)
-                        put("page_id", params.pageId)
-                        put("subject", finalSubject)
-                        put("updated_fields", updatedFields)
-                        if (params.referrerMemberIds != null) {
-                            put("referrer_count", params.referrerMemberIds.size)
-                        }
-                    },
-                message = "✅ 위키 페이지 '${finalSubject}'의 $updatedFields 을(를) 성공적으로 수정했습니다"
-            )
-
-        CallToolResult(content = listOf(TextContent(JsonUtils.toJsonString(successResponse))))
-    } else {
-        val errorResponse =
-            ToolException(
-                type = ToolException.API_ERROR,
-                message = response.header.resultMessage,
-                code = "DOORAY_API_${response.header.resultCode}"
-            )
-                .toErrorResponse()
-
-        CallToolResult(content = listOf(TextContent(JsonUtils.toJsonString(errorResponse))))
+    if (!response.header.isSuccessful) {
+        return response.header.toApiErrorResult()
     }
+
+    val updateParts = mutableListOf<String>()
+    if (params.newSubject != null) updateParts.add("제목")
+    if (params.newBodyContent != null) updateParts.add("내용")
+    if (params.referrerMemberIds != null) updateParts.add("참조자")
+
+    val updatedFields = updateParts.joinToString(", ")
+
+    return toolSuccess(
+        data =
+            buildJsonObject {
+                put("wiki_id", params.wikiId)
+                put("page_id", params.pageId)
+                put("subject", finalSubject)
+                put("updated_fields", updatedFields)
+                if (params.referrerMemberIds != null) {
+                    put("referrer_count", params.referrerMemberIds.size)
+                }
+            },
+        message = "✅ 위키 페이지 '${finalSubject}'의 $updatedFields 을(를) 성공적으로 수정했습니다"
+    )
 }
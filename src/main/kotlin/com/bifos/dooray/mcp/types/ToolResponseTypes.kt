@@ -10,15 +10,52 @@ data class ToolSuccessResponse<T>(
         val message: String? = null
 )
 
-/** 댓글 목록 조회 응답 데이터 */
+/** 페이지 단위 목록 도구 JSON Lines 응답의 첫 줄(메타데이터) */
 @Serializable
-data class PostCommentsResponseData(
-        val comments: List<PostComment>,
+data class ListResponseHeader(
+        val success: Boolean = true,
+        val message: String,
         val totalCount: Int,
         val currentPage: Int,
         val pageSize: Int
 )
 
+/** 프로젝트 목록 JSON Lines 응답의 첫 줄(메타데이터) - 적용한 필터 조건 포함 */
+@Serializable
+data class ProjectListResponseHeader(
+        val success: Boolean = true,
+        val message: String,
+        val totalCount: Int,
+        val currentPage: Int,
+        val pageSize: Int,
+        val filters: Map<String, String>
+)
+
+/** 업무 여러 건 동시 조회 JSON Lines 응답의 첫 줄(메타데이터) */
+@Serializable
+data class PostBatchResponseHeader(
+        val success: Boolean = true,
+        val message: String,
+        val totalCount: Int,
+        val failedCount: Int
+)
+
+/** 업무 상세 + 댓글 목록 동시 조회 응답 데이터 */
+@Serializable
+data class PostWithCommentsResponseData(
+        val post: PostDetail,
+        val comments: List<PostComment>,
+        val totalCommentCount: Int
+)
+
+/** 업무 여러 건 동시 조회의 항목별 결과 (성공 시 post, 실패 시 error) */
+@Serializable
+data class PostBatchItem(
+        val postId: String,
+        val post: PostDetail? = null,
+        val error: String? = null
+)
+
 /** 메신저 채널 목록 응답 데이터 */
 @Serializable
 data class ChannelListResponseData(
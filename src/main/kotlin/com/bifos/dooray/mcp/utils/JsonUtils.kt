@@ -1,39 +1,71 @@
 package com.bifos.dooray.mcp.utils
 
+import com.bifos.dooray.mcp.constants.EnvVariableConst.DOORAY_MCP_PRETTY
+import kotlinx.coroutines.Dispatchers
+import kotlinx.coroutines.withContext
 import kotlinx.serialization.json.Json
 import kotlinx.serialization.json.JsonArray
 import kotlinx.serialization.json.JsonElement
-import kotlinx.serialization.json.jsonPrimitive
+import kotlinx.serialization.json.JsonPrimitive
 import kotlinx.serialization.serializer
 
 object JsonUtils {
 
+    /** 도구 응답은 기본적으로 compact JSON 으로 직렬화하고, 디버깅 시 DOORAY_MCP_PRETTY=true 로 들여쓰기를 켭니다. */
     val json = Json {
         ignoreUnknownKeys = true
-        prettyPrint = true
+        prettyPrint = System.getenv(DOORAY_MCP_PRETTY).toBoolean()
         encodeDefaults = true
     }
 
+    /** JSON Lines 전용 인스턴스 - 한 줄에 문서 하나가 들어가야 하므로 DOORAY_MCP_PRETTY 와 무관하게 항상 compact */
+    @PublishedApi internal val jsonLines = Json(json) { prettyPrint = false }
+
     inline fun <reified T> toJsonString(value: T): String {
         return json.encodeToString(value)
     }
 
-    inline fun <reified T> fromJsonString(jsonString: String): T {
-        return json.decodeFromString(jsonString)
+    /**
+     * 목록 응답을 JSON Lines 형식으로 직렬화합니다.
+     * 첫 줄은 메타데이터(header), 이후 한 줄에 항목 하나씩 기록하여 전체 목록을 하나의 JSON 트리로 만들지 않습니다.
+     */
+    inline fun <reified H, reified T> toJsonLines(header: H, items: List<T>): String {
+        val itemSerializer = serializer<T>()
+        return buildString {
+            append(jsonLines.encodeToString(serializer<H>(), header))
+            append('\n')
+            for (item in items) {
+                append(jsonLines.encodeToString(itemSerializer, item))
+                append('\n')
+            }
+        }
     }
 
-    inline fun <reified T> toJsonElement(value: T): JsonElement {
-        return json.encodeToJsonElement(serializer<T>(), value)
+    /** 이 개수 이상의 목록은 직렬화를 Dispatchers.Default 에서 수행합니다. */
+    @PublishedApi internal const val OFFLOAD_ITEM_THRESHOLD = 100
+
+    /**
+     * toJsonLines 와 같지만, 큰 목록은 CPU 작업용 디스패처에서 직렬화합니다.
+     * 큰 응답을 직렬화하는 동안 요청 처리 스레드를 점유하여 다른 도구 호출이 멈추지 않도록 합니다.
+     */
+    suspend inline fun <reified H, reified T> toJsonLinesAsync(header: H, items: List<T>): String {
+        if (items.size < OFFLOAD_ITEM_THRESHOLD) return toJsonLines(header, items)
+        return withContext(Dispatchers.Default) { toJsonLines(header, items) }
+    }
+
+    inline fun <reified T> fromJsonString(jsonString: String): T {
+        return json.decodeFromString(jsonString)
     }
 
-    /** JSON 배열 문자열을 문자열 리스트로 파싱합니다. 예: ["item1", "item2"] -> listOf("item1", "item2") */
-    fun parseStringArray(jsonArrayString: String): List<String> {
-        return try {
-            val jsonArray = json.parseToJsonElement(jsonArrayString) as JsonArray
-            jsonArray.map { it.jsonPrimitive.content }
-        } catch (e: Exception) {
-            // 파싱 실패 시 빈 리스트 반환
-            emptyList()
+    /**
+     * 도구 인자로 받은 JSON 배열을 문자열 리스트로 변환합니다. 배열이 아니거나 원소가 문자열이 아니면 빈 리스트를 반환합니다.
+     * 이미 파싱된 JsonElement 를 그대로 읽으므로 문자열로 다시 직렬화했다가 파싱하지 않습니다.
+     */
+    fun toStringList(element: JsonElement): List<String> {
+        val jsonArray = element as? JsonArray ?: return emptyList()
+        // 숫자, null, 객체, 배열 원소는 문자열로 바꾸지 않고 잘못된 입력으로 봅니다.
+        return jsonArray.map { item ->
+            (item as? JsonPrimitive)?.takeIf { it.isString }?.content ?: return emptyList()
         }
     }
 }
@@ -0,0 +1,44 @@
+package com.bifos.dooray.mcp.utils
+
+import kotlinx.coroutines.CancellationException
+import kotlinx.coroutines.CompletableDeferred
+import kotlinx.coroutines.currentCoroutineContext
+import kotlinx.coroutines.isActive
+import java.util.concurrent.ConcurrentHashMap
+
+/**
+ * 같은 키로 동시에 들어온 호출을 하나로 합칩니다.
+ * 먼저 시작한 호출만 block 을 실행하고, 그 사이 들어온 호출들은 같은 결과(또는 예외)를 함께 기다립니다.
+ * 먼저 시작한 호출이 취소되면 기다리던 호출은 취소되지 않은 경우 스스로 다시 실행합니다.
+ */
+class SingleFlight<K : Any, V> {
+
+    private val inFlight = ConcurrentHashMap<K, CompletableDeferred<V>>()
+
+    suspend fun execute(key: K, block: suspend () -> V): V {
+        val deferred = CompletableDeferred<V>()
+        inFlight.putIfAbsent(key, deferred)?.let { existing ->
+            return try {
+                existing.await()
+            } catch (e: CancellationException) {
+                // 취소된 것이 이 호출 자신이라면 그대로 전파하고, 먼저 시작한 호출이 취소된 것이라면 다시 시도합니다.
+                if (!currentCoroutineContext().isActive) throw e
+                execute(key, block)
+            }
+        }
+
+        return try {
+            block().also { deferred.complete(it) }
+        } catch (e: CancellationException) {
+            // 재시도하는 호출이 취소된 deferred 를 다시 기다리지 않도록 먼저 제거합니다.
+            inFlight.remove(key, deferred)
+            deferred.cancel(e)
+            throw e
+        } catch (e: Throwable) {
+            deferred.completeExceptionally(e)
+            throw e
+        } finally {
+            inFlight.remove(key, deferred)
+        }
+    }
+}
@@ -0,0 +1,71 @@
+package com.bifos.dooray.mcp.utils
+
+import kotlin.time.Duration
+
+/**
+ * 최대 크기와 만료 시간(TTL)을 가진 인메모리 캐시입니다.
+ * 만료된 항목은 조회 시점에 제거되고, 용량을 넘으면 가장 오래 사용되지 않은 항목부터 제거합니다.
+ */
+class TtlCache<K : Any, V : Any>(
+    private val maxSize: Int,
+    ttl: Duration,
+    private val clock: () -> Long = System::nanoTime
+) {
+
+    private class Entry<T>(val value: T, val expiresAt: Long)
+
+    private val ttlNanos = ttl.inWholeNanoseconds
+
+    // accessOrder = true 로 LRU 순서를 유지합니다.
+    private val entries =
+        object : LinkedHashMap<K, Entry<V>>(16, 0.75f, true) {
+            override fun removeEldestEntry(eldest: MutableMap.MutableEntry<K, Entry<V>>?): Boolean {
+                return size > maxSize
+            }
+        }
+
+    private var currentGeneration = 0L
+
+    /** 만료되지 않은 항목 수. 아직 제거되지 않은 만료 항목은 세기 전에 정리합니다. */
+    val size: Int
+        @Synchronized get() {
+            val now = clock()
+            entries.values.removeIf { now - it.expiresAt >= 0 }
+            return entries.size
+        }
+
+    /** clear() 할 때마다 증가하는 세대 번호. 조회 시작 시점의 값을 기록해 두었다가 put 에 넘깁니다. */
+    val generation: Long
+        @Synchronized get() = currentGeneration
+
+    @Synchronized
+    fun get(key: K): V? {
+        val entry = entries[key] ?: return null
+        // System.nanoTime 은 오버플로우될 수 있으므로 차이로 비교합니다.
+        if (clock() - entry.expiresAt >= 0) {
+            entries.remove(key)
+            return null
+        }
+        return entry.value
+    }
+
+    @Synchronized
+    fun put(key: K, value: V) {
+        entries[key] = Entry(value, clock() + ttlNanos)
+    }
+
+    /**
+     * 값을 읽기 시작한 뒤 clear() 가 호출되지 않았을 때만 저장합니다.
+     * 무효화 이전 상태를 읽은 결과가 무효화 이후에 저장되어 TTL 동안 남는 것을 막습니다.
+     */
+    @Synchronized
+    fun put(key: K, value: V, expectedGeneration: Long) {
+        if (expectedGeneration == currentGeneration) put(key, value)
+    }
+
+    @Synchronized
+    fun clear() {
+        entries.clear()
+        currentGeneration++
+    }
+}
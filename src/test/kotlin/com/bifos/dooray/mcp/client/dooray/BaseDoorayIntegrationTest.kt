@@ -25,20 +25,13 @@ abstract class BaseDoorayIntegrationTest {
     fun setup() {
         val env = parseEnv()
 
-        val baseUrl =
-            env[EnvVariableConst.DOORAY_BASE_URL]
-                ?: throw IllegalStateException("DOORAY_BASE_URL 환경변수가 설정되지 않았습니다.")
-        val apiKey =
-            env[EnvVariableConst.DOORAY_API_KEY]
-                ?: throw IllegalStateException("DOORAY_API_KEY 환경변수가 설정되지 않았습니다.")
+        doorayClient = sharedClient
         this.testProjectId =
             env[EnvVariableConst.DOORAY_TEST_PROJECT_ID]
                 ?: throw IllegalStateException("DOORAY_TEST_PROJECT_ID 환경변수가 설정되지 않았습니다.")
         this.testWikiId =
             env[EnvVariableConst.DOORAY_TEST_WIKI_ID]
                 ?: throw IllegalStateException("DOORAY_TEST_WIKI_ID 환경변수가 설정되지 않았습니다.")
-
-        doorayClient = DoorayHttpClient(baseUrl, apiKey)
     }
 
     @AfterAll
@@ -75,4 +68,25 @@ abstract class BaseDoorayIntegrationTest {
             println("   - Wiki Pages: ${createdWikiPageIds.joinToString(", ")}")
         }
     }
-}
\ No newline at end of file
+
+    companion object {
+        /**
+         * 모든 통합 테스트 클래스가 공유하는 HTTP 클라이언트입니다.
+         * 테스트 클래스마다 클라이언트(와 연결 풀)를 새로 만들지 않도록 테스트 JVM 에서 한 번만 생성하고, 종료 시 닫습니다.
+         */
+        private val sharedClient: DoorayHttpClient by lazy {
+            val env = parseEnv()
+
+            val baseUrl =
+                env[EnvVariableConst.DOORAY_BASE_URL]
+                    ?: throw IllegalStateException("DOORAY_BASE_URL 환경변수가 설정되지 않았습니다.")
+            val apiKey =
+                env[EnvVariableConst.DOORAY_API_KEY]
+                    ?: throw IllegalStateException("DOORAY_API_KEY 환경변수가 설정되지 않았습니다.")
+
+            DoorayHttpClient(baseUrl, apiKey).also { client ->
+                Runtime.getRuntime().addShutdownHook(Thread(client::close))
+            }
+        }
+    }
+}
@@ -3,11 +3,17 @@ package com.bifos.dooray.mcp.tools
 import com.bifos.dooray.mcp.client.DoorayClient
 import com.bifos.dooray.mcp.types.*
 import io.mockk.coEvery
-import io.mockk.every
+import io.mockk.coVerify
 import io.mockk.mockk
 import io.modelcontextprotocol.kotlin.sdk.CallToolRequest
+import io.modelcontextprotocol.kotlin.sdk.CallToolResult
 import io.modelcontextprotocol.kotlin.sdk.TextContent
+import kotlinx.coroutines.CompletableDeferred
+import kotlinx.coroutines.async
+import kotlinx.coroutines.delay
 import kotlinx.coroutines.test.runTest
+import kotlinx.coroutines.yield
+import kotlinx.serialization.json.JsonObjectBuilder
 import kotlinx.serialization.json.add
 import kotlinx.serialization.json.buildJsonObject
 import kotlinx.serialization.json.put
@@ -15,12 +21,46 @@ import kotlinx.serialization.json.putJsonArray
 import org.junit.jupiter.api.DisplayName
 import org.junit.jupiter.api.Test
 import org.junit.jupiter.api.TestInstance
+import org.junit.jupiter.params.ParameterizedTest
+import org.junit.jupiter.params.provider.CsvSource
 import kotlin.test.assertContains
+import kotlin.test.assertEquals
 import kotlin.test.assertTrue
 
 @TestInstance(TestInstance.Lifecycle.PER_CLASS)
 class McpToolsUnitTest {
 
+    /** 성공 응답 mock 들이 공유하는 두레이 API 헤더 */
+    private val successHeader =
+        DoorayApiHeader(isSuccessful = true, resultCode = 0, resultMessage = "success")
+
+    /** 업무 상세 조회 mock 들이 공유하는 업무 (data class 이므로 테스트 간에 공유해도 변경되지 않음) */
+    private val samplePost =
+        PostDetail(
+            id = "post1",
+            subject = "테스트 업무",
+            project = ProjectInfo(id = "project1", code = "TEST"),
+            taskNumber = "TEST-1",
+            closed = false,
+            createdAt = "2025-01-25T10:00:00+09:00",
+            updatedAt = "2025-01-25T10:00:00+09:00",
+            number = 1,
+            priority = "normal",
+            workflowClass = "registered",
+            workflow = Workflow(id = "workflow1", name = "등록"),
+            body = PostBody(mimeType = "text/x-markdown", content = "업무 본문"),
+            users =
+                PostUsers(
+                    from =
+                        PostUser(
+                            type = "member",
+                            member = Member(organizationMemberId = "member1")
+                        ),
+                    to = emptyList(),
+                    cc = emptyList()
+                )
+        )
+
     @Test
     @DisplayName("위키 목록 조회 도구 - 성공 케이스")
     fun testGetWikisHandlerSuccess() = runTest {
@@ -40,23 +80,16 @@ class McpToolsUnitTest {
             )
         val mockResponse =
             WikiListResponse(
-                header =
-                    DoorayApiHeader(
-                        isSuccessful = true,
-                        resultCode = 0,
-                        resultMessage = "success"
-                    ),
+                header = successHeader,
                 result = mockWikis
             )
 
         coEvery { mockDoorayClient.getWikis(any(), any()) } returns mockResponse
 
-        val mockRequest = mockk<CallToolRequest>()
-        every { mockRequest.arguments } returns
-                buildJsonObject {
-                    put("page", 0)
-                    put("size", 10)
-                }
+        val mockRequest = toolRequest {
+            put("page", 0)
+            put("size", 10)
+        }
 
         // when
         val handler = getWikisHandler(mockDoorayClient)
@@ -66,7 +99,7 @@ class McpToolsUnitTest {
         assertTrue(result.content.isNotEmpty())
         val content = result.content.first() as TextContent
         val responseText = content.text ?: ""
-        assertContains(responseText, "\"success\": true")
+        assertContains(responseText, "\"success\":true")
         assertContains(responseText, "테스트 위키")
     }
 
@@ -89,8 +122,7 @@ class McpToolsUnitTest {
 
         coEvery { mockDoorayClient.getWikis(any(), any()) } returns mockResponse
 
-        val mockRequest = mockk<CallToolRequest>()
-        every { mockRequest.arguments } returns buildJsonObject {}
+        val mockRequest = toolRequest()
 
         // when
         val handler = getWikisHandler(mockDoorayClient)
@@ -100,7 +132,7 @@ class McpToolsUnitTest {
         assertTrue(result.content.isNotEmpty())
         val content = result.content.first() as TextContent
         val responseText = content.text ?: ""
-        assertContains(responseText, "\"isError\": true")
+        assertContains(responseText, "\"isError\":true")
         assertContains(responseText, "Bad Request")
     }
 
@@ -127,19 +159,13 @@ class McpToolsUnitTest {
             )
         val mockResponse =
             WikiPagesResponse(
-                header =
-                    DoorayApiHeader(
-                        isSuccessful = true,
-                        resultCode = 0,
-                        resultMessage = "success"
-                    ),
+                header = successHeader,
                 result = mockPages
             )
 
         coEvery { mockDoorayClient.getWikiPages(any<String>()) } returns mockResponse
 
-        val mockRequest = mockk<CallToolRequest>()
-        every { mockRequest.arguments } returns buildJsonObject { put("project_id", "project1") }
+        val mockRequest = toolRequest { put("project_id", "project1") }
 
         // when
         val handler = getWikiPagesHandler(mockDoorayClient)
@@ -149,7 +175,7 @@ class McpToolsUnitTest {
         assertTrue(result.content.isNotEmpty())
         val content = result.content.first() as TextContent
         val responseText = content.text ?: ""
-        assertContains(responseText, "\"success\": true")
+        assertContains(responseText, "\"success\":true")
         assertContains(responseText, "테스트 페이지")
     }
 
@@ -159,8 +185,7 @@ class McpToolsUnitTest {
         // given
         val mockDoorayClient = mockk<DoorayClient>()
 
-        val mockRequest = mockk<CallToolRequest>()
-        every { mockRequest.arguments } returns buildJsonObject {} // project_id 누락
+        val mockRequest = toolRequest() // project_id 누락
 
         // when
         val handler = getWikiPagesHandler(mockDoorayClient)
@@ -170,7 +195,7 @@ class McpToolsUnitTest {
         assertTrue(result.content.isNotEmpty())
         val content = result.content.first() as TextContent
         val responseText = content.text ?: ""
-        assertContains(responseText, "\"isError\": true")
+        assertContains(responseText, "\"isError\":true")
         assertContains(responseText, "MISSING_PROJECT_ID")
     }
 
@@ -193,12 +218,7 @@ class McpToolsUnitTest {
             )
         val mockResponse =
             ProjectListResponse(
-                header =
-                    DoorayApiHeader(
-                        isSuccessful = true,
-                        resultCode = 0,
-                        resultMessage = "success"
-                    ),
+                header = successHeader,
                 result = mockProjects,
                 totalCount = 1
             )
@@ -206,12 +226,10 @@ class McpToolsUnitTest {
         coEvery { mockDoorayClient.getProjects(any(), any(), any(), any(), any()) } returns
                 mockResponse
 
-        val mockRequest = mockk<CallToolRequest>()
-        every { mockRequest.arguments } returns
-                buildJsonObject {
-                    put("page", 0)
-                    put("size", 20)
-                }
+        val mockRequest = toolRequest {
+            put("page", 0)
+            put("size", 20)
+        }
 
         // when
         val handler = getProjectsHandler(mockDoorayClient)
@@ -221,18 +239,56 @@ class McpToolsUnitTest {
         assertTrue(result.content.isNotEmpty())
         val content = result.content.first() as TextContent
         val responseText = content.text ?: ""
-        assertContains(responseText, "\"success\": true")
+        assertContains(responseText, "\"success\":true")
         assertContains(responseText, "TEST")
     }
 
+    @Test
+    @DisplayName("프로젝트 목록 조회 도구 - 같은 조건의 재조회는 캐시 사용")
+    fun testGetProjectsHandlerCacheHit() = runTest {
+        // given
+        val mockDoorayClient = mockk<DoorayClient>()
+
+        val mockResponse =
+            ProjectListResponse(
+                header = successHeader,
+                result = listOf(Project(id = "project1", code = "CACHED")),
+                totalCount = 1
+            )
+
+        coEvery { mockDoorayClient.getProjects(any(), any(), any(), any(), any()) } returns
+                mockResponse
+
+        val mockRequest = toolRequest { put("page", 0) }
+
+        val projectsCache = createProjectsCache()
+        val handler =
+            cachedGet(getProjectsTool().name, projectsCache, getProjectsHandler(mockDoorayClient))
+
+        // when
+        val first = handler(mockRequest)
+        val second = handler(mockRequest)
+
+        // then
+        coVerify(exactly = 1) { mockDoorayClient.getProjects(any(), any(), any(), any(), any()) }
+        assertEquals(
+            (first.content.first() as TextContent).text,
+            (second.content.first() as TextContent).text
+        )
+
+        // 캐시를 비우면 다시 API 를 호출
+        clearProjectsCacheHandler(projectsCache)(mockRequest)
+        handler(mockRequest)
+        coVerify(exactly = 2) { mockDoorayClient.getProjects(any(), any(), any(), any(), any()) }
+    }
+
     @Test
     @DisplayName("프로젝트 업무 목록 조회 도구 - project_id 누락 에러")
     fun testGetProjectPostsHandlerMissingProjectId() = runTest {
         // given
         val mockDoorayClient = mockk<DoorayClient>()
 
-        val mockRequest = mockk<CallToolRequest>()
-        every { mockRequest.arguments } returns buildJsonObject {} // project_id 누락
+        val mockRequest = toolRequest() // project_id 누락
 
         // when
         val handler = getProjectPostsHandler(mockDoorayClient)
@@ -242,10 +298,103 @@ class McpToolsUnitTest {
         assertTrue(result.content.isNotEmpty())
         val content = result.content.first() as TextContent
         val responseText = content.text ?: ""
-        assertContains(responseText, "\"isError\": true")
+        assertContains(responseText, "\"isError\":true")
         assertContains(responseText, "MISSING_PROJECT_ID")
     }
 
+    @Test
+    @DisplayName("조회 도구 캐시 - 같은 인자는 캐시 사용, 에러 응답은 캐싱하지 않음")
+    fun testCachedGetSkipsErrorResults() = runTest {
+        // given
+        var calls = 0
+        val readCache = createReadCache()
+        val handler =
+            cachedGet("dooray_project_get_post", readCache) { request ->
+                calls++
+                val isError = request.arguments["post_id"] == null
+                CallToolResult(content = listOf(TextContent("call $calls")), isError = isError)
+            }
+
+        val okRequest = toolRequest {
+            put("project_id", "project1")
+            put("post_id", "post1")
+        }
+        val reorderedRequest = toolRequest {
+            put("post_id", "post1")
+            put("project_id", "project1")
+        }
+        val errorRequest = toolRequest { put("project_id", "project1") }
+
+        // when & then: 인자 순서가 달라도 같은 키로 캐시 적중
+        handler(okRequest)
+        val cached = handler(reorderedRequest)
+        assertEquals(1, calls)
+        assertEquals("call 1", (cached.content.first() as TextContent).text)
+
+        handler(errorRequest)
+        handler(errorRequest)
+        assertEquals(3, calls)
+
+        // 변경 도구를 거치면 캐시가 비워짐
+        invalidatesCache(readCache) { CallToolResult(content = emptyList()) }(okRequest)
+        handler(okRequest)
+        assertEquals(4, calls)
+    }
+
+    @Test
+    @DisplayName("조회 도구 캐시 - 변경 도구 실행 전에 시작된 조회 결과는 캐싱하지 않음")
+    fun testCachedGetDropsResultReadBeforeInvalidation() = runTest {
+        // given
+        var calls = 0
+        val gate = CompletableDeferred<Unit>()
+        val readCache = createReadCache()
+        val handler =
+            cachedGet("dooray_project_get_post", readCache) {
+                calls++
+                if (calls == 1) gate.await() // 첫 조회는 변경 이전 상태를 읽은 채로 대기
+                CallToolResult(content = listOf(TextContent("call $calls")))
+            }
+        val request = toolRequest {
+            put("project_id", "project1")
+            put("post_id", "post1")
+        }
+
+        // when: 조회가 끝나기 전에 변경 도구가 캐시를 비움
+        val staleRead = async { handler(request) }
+        yield()
+        invalidatesCache(readCache) { CallToolResult(content = emptyList()) }(request)
+        gate.complete(Unit)
+        staleRead.await()
+
+        // then: 이전 조회 결과가 캐시에 남지 않아 다음 조회는 핸들러를 다시 호출
+        val next = handler(request)
+        assertEquals(2, calls)
+        assertEquals("call 2", (next.content.first() as TextContent).text)
+    }
+
+    @Test
+    @DisplayName("프로젝트 업무 상세 조회 도구 - 예외 발생 시 INTERNAL_ERROR 에러 응답")
+    fun testGetProjectPostHandlerInternalError() = runTest {
+        // given
+        val mockDoorayClient = mockk<DoorayClient>()
+        coEvery { mockDoorayClient.getPost(any(), any()) } throws IllegalStateException("boom")
+
+        val mockRequest = toolRequest {
+            put("project_id", "project1")
+            put("post_id", "post1")
+        }
+
+        // when
+        val handler = getProjectPostHandler(mockDoorayClient)
+        val result = handler(mockRequest)
+
+        // then
+        assertEquals(true, result.isError)
+        val responseText = (result.content.first() as TextContent).text ?: ""
+        assertContains(responseText, "INTERNAL_ERROR")
+        assertContains(responseText, "boom")
+    }
+
     @Test
     @DisplayName("위키 페이지 생성 도구 - 성공 케이스")
     fun testCreateWikiPageHandlerSuccess() = runTest {
@@ -254,12 +403,7 @@ class McpToolsUnitTest {
 
         val mockResponse =
             CreateWikiPageResponse(
-                header =
-                    DoorayApiHeader(
-                        isSuccessful = true,
-                        resultCode = 0,
-                        resultMessage = "success"
-                    ),
+                header = successHeader,
                 result =
                     CreateWikiPageResult(
                         id = "page1",
@@ -271,14 +415,12 @@ class McpToolsUnitTest {
 
         coEvery { mockDoorayClient.createWikiPage(any(), any()) } returns mockResponse
 
-        val mockRequest = mockk<CallToolRequest>()
-        every { mockRequest.arguments } returns
-                buildJsonObject {
-                    put("wiki_id", "wiki1")
-                    put("subject", "새 위키 페이지")
-                    put("body", "새 위키 페이지 내용")
-                    put("parent_page_id", "parent1")
-                }
+        val mockRequest = toolRequest {
+            put("wiki_id", "wiki1")
+            put("subject", "새 위키 페이지")
+            put("body", "새 위키 페이지 내용")
+            put("parent_page_id", "parent1")
+        }
 
         // when
         val handler = createWikiPageHandler(mockDoorayClient)
@@ -288,7 +430,7 @@ class McpToolsUnitTest {
         assertTrue(result.content.isNotEmpty())
         val content = result.content.first() as TextContent
         val responseText = content.text ?: ""
-        assertContains(responseText, "\"success\": true")
+        assertContains(responseText, "\"success\":true")
         assertContains(responseText, "성공적으로 생성")
     }
 
@@ -298,14 +440,12 @@ class McpToolsUnitTest {
         // given
         val mockDoorayClient = mockk<DoorayClient>()
 
-        val mockRequest = mockk<CallToolRequest>()
-        every { mockRequest.arguments } returns
-                buildJsonObject {
-                    put("subject", "새 위키 페이지")
-                    put("body", "새 위키 페이지 내용")
-                    put("parent_page_id", "parent1")
-                    // wiki_id 누락
-                }
+        val mockRequest = toolRequest {
+            put("subject", "새 위키 페이지")
+            put("body", "새 위키 페이지 내용")
+            put("parent_page_id", "parent1")
+            // wiki_id 누락
+        }
 
         // when
         val handler = createWikiPageHandler(mockDoorayClient)
@@ -315,7 +455,7 @@ class McpToolsUnitTest {
         assertTrue(result.content.isNotEmpty())
         val content = result.content.first() as TextContent
         val responseText = content.text ?: ""
-        assertContains(responseText, "\"isError\": true")
+        assertContains(responseText, "\"isError\":true")
         assertContains(responseText, "MISSING_WIKI_ID")
     }
 
@@ -327,28 +467,21 @@ class McpToolsUnitTest {
 
         val mockResponse =
             CreatePostApiResponse(
-                header =
-                    DoorayApiHeader(
-                        isSuccessful = true,
-                        resultCode = 0,
-                        resultMessage = "success"
-                    ),
+                header = successHeader,
                 result = CreatePostResponse(id = "post1")
             )
 
         coEvery { mockDoorayClient.createPost(any(), any()) } returns mockResponse
 
-        val mockRequest = mockk<CallToolRequest>()
-        every { mockRequest.arguments } returns
-                buildJsonObject {
-                    put("project_id", "project1")
-                    put("subject", "새 업무")
-                    put("body", "새 업무 내용")
-                    putJsonArray("to_member_ids") {
-                        add("member1")
-                        add("member2")
-                    }
-                }
+        val mockRequest = toolRequest {
+            put("project_id", "project1")
+            put("subject", "새 업무")
+            put("body", "새 업무 내용")
+            putJsonArray("to_member_ids") {
+                add("member1")
+                add("member2")
+            }
+        }
 
         // when
         val handler = createProjectPostHandler(mockDoorayClient)
@@ -358,7 +491,7 @@ class McpToolsUnitTest {
         assertTrue(result.content.isNotEmpty())
         val content = result.content.first() as TextContent
         val responseText = content.text ?: ""
-        assertContains(responseText, "\"success\": true")
+        assertContains(responseText, "\"success\":true")
         assertContains(responseText, "성공적으로 생성")
     }
 
@@ -368,14 +501,12 @@ class McpToolsUnitTest {
         // given
         val mockDoorayClient = mockk<DoorayClient>()
 
-        val mockRequest = mockk<CallToolRequest>()
-        every { mockRequest.arguments } returns
-                buildJsonObject {
-                    put("project_id", "project1")
-                    put("subject", "새 업무")
-                    put("body", "새 업무 내용")
-                    // to_member_ids 누락
-                }
+        val mockRequest = toolRequest {
+            put("project_id", "project1")
+            put("subject", "새 업무")
+            put("body", "새 업무 내용")
+            // to_member_ids 누락
+        }
 
         // when
         val handler = createProjectPostHandler(mockDoorayClient)
@@ -385,7 +516,7 @@ class McpToolsUnitTest {
         assertTrue(result.content.isNotEmpty())
         val content = result.content.first() as TextContent
         val responseText = content.text ?: ""
-        assertContains(responseText, "\"isError\": true")
+        assertContains(responseText, "\"isError\":true")
         assertContains(responseText, "MISSING_TO_MEMBER_IDS")
     }
 
@@ -395,13 +526,11 @@ class McpToolsUnitTest {
         // given
         val mockDoorayClient = mockk<DoorayClient>()
 
-        val mockRequest = mockk<CallToolRequest>()
-        every { mockRequest.arguments } returns
-                buildJsonObject {
-                    put("wiki_id", "wiki1")
-                    put("page_id", "page1")
-                    // subject, body, referrer_member_ids 모두 누락
-                }
+        val mockRequest = toolRequest {
+            put("wiki_id", "wiki1")
+            put("page_id", "page1")
+            // subject, body, referrer_member_ids 모두 누락
+        }
 
         // when
         val handler = updateWikiPageHandler(mockDoorayClient)
@@ -411,7 +540,7 @@ class McpToolsUnitTest {
         assertTrue(result.content.isNotEmpty())
         val content = result.content.first() as TextContent
         val responseText = content.text ?: ""
-        assertContains(responseText, "\"isError\": true")
+        assertContains(responseText, "\"isError\":true")
         assertContains(responseText, "NO_UPDATE_CONTENT")
     }
 
@@ -448,12 +577,7 @@ class McpToolsUnitTest {
             )
         val mockResponse =
             PostCommentListResponse(
-                header =
-                    DoorayApiHeader(
-                        isSuccessful = true,
-                        resultCode = 0,
-                        resultMessage = "success"
-                    ),
+                header = successHeader,
                 result = mockComments,
                 totalCount = 1
             )
@@ -461,14 +585,12 @@ class McpToolsUnitTest {
         coEvery { mockDoorayClient.getPostComments(any(), any(), any(), any(), any()) } returns
                 mockResponse
 
-        val mockRequest = mockk<CallToolRequest>()
-        every { mockRequest.arguments } returns
-                buildJsonObject {
-                    put("project_id", "project1")
-                    put("post_id", "post1")
-                    put("page", 0)
-                    put("size", 10)
-                }
+        val mockRequest = toolRequest {
+            put("project_id", "project1")
+            put("post_id", "post1")
+            put("page", 0)
+            put("size", 10)
+        }
 
         // when
         val handler = getPostCommentsHandler(mockDoorayClient)
@@ -478,11 +600,13 @@ class McpToolsUnitTest {
         assertTrue(result.content.isNotEmpty())
         val content = result.content.first() as TextContent
         val responseText = content.text ?: ""
-        assertContains(responseText, "\"success\": true")
-        assertContains(responseText, "\"comments\":")
-        assertContains(responseText, "\"totalCount\": 1")
-        assertContains(responseText, "\"currentPage\": 0")
-        assertContains(responseText, "\"pageSize\": 10")
+        // JSON Lines: 첫 줄은 메타데이터, 이후 한 줄에 댓글 하나
+        val lines = responseText.trimEnd().lines()
+        assertEquals(2, lines.size)
+        assertContains(lines.first(), "\"success\":true")
+        assertContains(responseText, "\"totalCount\":1")
+        assertContains(responseText, "\"currentPage\":0")
+        assertContains(responseText, "\"pageSize\":10")
         assertContains(responseText, "테스트 댓글입니다")
     }
 
@@ -492,12 +616,10 @@ class McpToolsUnitTest {
         // given
         val mockDoorayClient = mockk<DoorayClient>()
 
-        val mockRequest = mockk<CallToolRequest>()
-        every { mockRequest.arguments } returns
-                buildJsonObject {
-                    put("post_id", "post1")
-                    // project_id 누락
-                }
+        val mockRequest = toolRequest {
+            put("post_id", "post1")
+            // project_id 누락
+        }
 
         // when
         val handler = getPostCommentsHandler(mockDoorayClient)
@@ -507,7 +629,7 @@ class McpToolsUnitTest {
         assertTrue(result.content.isNotEmpty())
         val content = result.content.first() as TextContent
         val responseText = content.text ?: ""
-        assertContains(responseText, "\"isError\": true")
+        assertContains(responseText, "\"isError\":true")
         assertContains(responseText, "MISSING_PROJECT_ID")
     }
 
@@ -517,12 +639,10 @@ class McpToolsUnitTest {
         // given
         val mockDoorayClient = mockk<DoorayClient>()
 
-        val mockRequest = mockk<CallToolRequest>()
-        every { mockRequest.arguments } returns
-                buildJsonObject {
-                    put("project_id", "project1")
-                    // post_id 누락
-                }
+        val mockRequest = toolRequest {
+            put("project_id", "project1")
+            // post_id 누락
+        }
 
         // when
         val handler = getPostCommentsHandler(mockDoorayClient)
@@ -532,7 +652,7 @@ class McpToolsUnitTest {
         assertTrue(result.content.isNotEmpty())
         val content = result.content.first() as TextContent
         val responseText = content.text ?: ""
-        assertContains(responseText, "\"isError\": true")
+        assertContains(responseText, "\"isError\":true")
         assertContains(responseText, "MISSING_POST_ID")
     }
 
@@ -557,12 +677,10 @@ class McpToolsUnitTest {
         coEvery { mockDoorayClient.getPostComments(any(), any(), any(), any(), any()) } returns
                 mockResponse
 
-        val mockRequest = mockk<CallToolRequest>()
-        every { mockRequest.arguments } returns
-                buildJsonObject {
-                    put("project_id", "project1")
-                    put("post_id", "invalid_post_id")
-                }
+        val mockRequest = toolRequest {
+            put("project_id", "project1")
+            put("post_id", "invalid_post_id")
+        }
 
         // when
         val handler = getPostCommentsHandler(mockDoorayClient)
@@ -572,7 +690,7 @@ class McpToolsUnitTest {
         assertTrue(result.content.isNotEmpty())
         val content = result.content.first() as TextContent
         val responseText = content.text ?: ""
-        assertContains(responseText, "\"isError\": true")
+        assertContains(responseText, "\"isError\":true")
         assertContains(responseText, "Post not found")
         assertContains(responseText, "DOORAY_API_404")
     }
@@ -585,24 +703,17 @@ class McpToolsUnitTest {
 
         val mockResponse =
             CreateCommentApiResponse(
-                header =
-                    DoorayApiHeader(
-                        isSuccessful = true,
-                        resultCode = 0,
-                        resultMessage = "success"
-                    ),
+                header = successHeader,
                 result = CreateCommentResponse(id = "comment1")
             )
 
         coEvery { mockDoorayClient.createPostComment(any(), any(), any()) } returns mockResponse
 
-        val mockRequest = mockk<CallToolRequest>()
-        every { mockRequest.arguments } returns
-                buildJsonObject {
-                    put("project_id", "project1")
-                    put("post_id", "post1")
-                    put("content", "새 댓글 내용")
-                }
+        val mockRequest = toolRequest {
+            put("project_id", "project1")
+            put("post_id", "post1")
+            put("content", "새 댓글 내용")
+        }
 
         // when
         val handler = createPostCommentHandler(mockDoorayClient)
@@ -612,7 +723,7 @@ class McpToolsUnitTest {
         assertTrue(result.content.isNotEmpty())
         val content = result.content.first() as TextContent
         val responseText = content.text ?: ""
-        assertContains(responseText, "\"success\": true")
+        assertContains(responseText, "\"success\":true")
         assertContains(responseText, "성공적으로 생성")
     }
 
@@ -622,13 +733,11 @@ class McpToolsUnitTest {
         // given
         val mockDoorayClient = mockk<DoorayClient>()
 
-        val mockRequest = mockk<CallToolRequest>()
-        every { mockRequest.arguments } returns
-                buildJsonObject {
-                    put("project_id", "project1")
-                    put("post_id", "post1")
-                    // content 누락
-                }
+        val mockRequest = toolRequest {
+            put("project_id", "project1")
+            put("post_id", "post1")
+            // content 누락
+        }
 
         // when
         val handler = createPostCommentHandler(mockDoorayClient)
@@ -638,7 +747,7 @@ class McpToolsUnitTest {
         assertTrue(result.content.isNotEmpty())
         val content = result.content.first() as TextContent
         val responseText = content.text ?: ""
-        assertContains(responseText, "\"isError\": true")
+        assertContains(responseText, "\"isError\":true")
         assertContains(responseText, "MISSING_CONTENT")
     }
 
@@ -650,26 +759,19 @@ class McpToolsUnitTest {
 
         val mockResponse =
             UpdateCommentResponse(
-                header =
-                    DoorayApiHeader(
-                        isSuccessful = true,
-                        resultCode = 0,
-                        resultMessage = "success"
-                    ),
+                header = successHeader,
                 result = null
             )
 
         coEvery { mockDoorayClient.updatePostComment(any(), any(), any(), any()) } returns
                 mockResponse
 
-        val mockRequest = mockk<CallToolRequest>()
-        every { mockRequest.arguments } returns
-                buildJsonObject {
-                    put("project_id", "project1")
-                    put("post_id", "post1")
-                    put("log_id", "comment1")
-                    put("content", "수정된 댓글 내용")
-                }
+        val mockRequest = toolRequest {
+            put("project_id", "project1")
+            put("post_id", "post1")
+            put("log_id", "comment1")
+            put("content", "수정된 댓글 내용")
+        }
 
         // when
         val handler = updatePostCommentHandler(mockDoorayClient)
@@ -679,7 +781,7 @@ class McpToolsUnitTest {
         assertTrue(result.content.isNotEmpty())
         val content = result.content.first() as TextContent
         val responseText = content.text ?: ""
-        assertContains(responseText, "\"success\": true")
+        assertContains(responseText, "\"success\":true")
         assertContains(responseText, "성공적으로 수정")
     }
 
@@ -691,24 +793,17 @@ class McpToolsUnitTest {
 
         val mockResponse =
             DeleteCommentResponse(
-                header =
-                    DoorayApiHeader(
-                        isSuccessful = true,
-                        resultCode = 0,
-                        resultMessage = "success"
-                    ),
+                header = successHeader,
                 result = null
             )
 
         coEvery { mockDoorayClient.deletePostComment(any(), any(), any()) } returns mockResponse
 
-        val mockRequest = mockk<CallToolRequest>()
-        every { mockRequest.arguments } returns
-                buildJsonObject {
-                    put("project_id", "project1")
-                    put("post_id", "post1")
-                    put("log_id", "comment1")
-                }
+        val mockRequest = toolRequest {
+            put("project_id", "project1")
+            put("post_id", "post1")
+            put("log_id", "comment1")
+        }
 
         // when
         val handler = deletePostCommentHandler(mockDoorayClient)
@@ -718,7 +813,185 @@ class McpToolsUnitTest {
         assertTrue(result.content.isNotEmpty())
         val content = result.content.first() as TextContent
         val responseText = content.text ?: ""
-        assertContains(responseText, "\"success\": true")
+        assertContains(responseText, "\"success\":true")
         assertContains(responseText, "성공적으로 삭제")
     }
+
+    @Test
+    @DisplayName("업무 상세 + 댓글 동시 조회 도구 - 성공 케이스")
+    fun testGetProjectPostWithCommentsHandlerSuccess() = runTest {
+        // given
+        val mockDoorayClient = mockk<DoorayClient>()
+
+        val mockComments =
+            listOf(
+                PostComment(
+                    id = "comment1",
+                    post = PostInfo(id = "post1"),
+                    type = "comment",
+                    subtype = "general",
+                    createdAt = "2025-01-25T11:00:00+09:00",
+                    modifiedAt = null,
+                    creator =
+                        PostUser(
+                            type = "member",
+                            member = Member(organizationMemberId = "member1")
+                        ),
+                    mailUsers = null,
+                    body = PostCommentBody(mimeType = "text/html", content = "동시 조회 댓글"),
+                    files = null
+                )
+            )
+
+        coEvery { mockDoorayClient.getPost("project1", "post1") } returns
+                PostDetailResponse(header = successHeader, result = samplePost)
+        coEvery {
+            mockDoorayClient.getPostComments("project1", "post1", 0, 50, null)
+        } returns
+                PostCommentListResponse(
+                    header = successHeader,
+                    result = mockComments,
+                    totalCount = 1
+                )
+
+        val mockRequest = toolRequest {
+            put("project_id", "project1")
+            put("post_id", "post1")
+        }
+
+        // when
+        val handler = getProjectPostWithCommentsHandler(mockDoorayClient)
+        val result = handler(mockRequest)
+
+        // then
+        assertTrue(result.content.isNotEmpty())
+        val content = result.content.first() as TextContent
+        val responseText = content.text ?: ""
+        assertContains(responseText, "\"success\":true")
+        assertContains(responseText, "테스트 업무")
+        assertContains(responseText, "동시 조회 댓글")
+        assertContains(responseText, "\"totalCommentCount\":1")
+    }
+
+    @Test
+    @DisplayName("업무 상세 + 댓글 동시 조회 도구 - post_id 누락 에러")
+    fun testGetProjectPostWithCommentsHandlerMissingPostId() = runTest {
+        // given
+        val mockDoorayClient = mockk<DoorayClient>()
+
+        val mockRequest = toolRequest { put("project_id", "project1") } // post_id 누락
+
+        // when
+        val handler = getProjectPostWithCommentsHandler(mockDoorayClient)
+        val result = handler(mockRequest)
+
+        // then
+        assertTrue(result.content.isNotEmpty())
+        val content = result.content.first() as TextContent
+        val responseText = content.text ?: ""
+        assertContains(responseText, "\"isError\":true")
+        assertContains(responseText, "MISSING_POST_ID")
+    }
+
+    @Test
+    @DisplayName("업무 여러 건 동시 조회 도구 - 일부 실패해도 요청 순서대로 결과 반환")
+    fun testGetProjectPostsBatchHandlerPartialFailure() = runTest {
+        // given
+        val mockDoorayClient = mockk<DoorayClient>()
+
+        coEvery { mockDoorayClient.getPost("project1", "post1") } returns
+                PostDetailResponse(
+                    header = successHeader,
+                    result = samplePost
+                )
+        coEvery { mockDoorayClient.getPost("project1", "post2") } throws
+                IllegalStateException("not found")
+
+        val mockRequest = toolRequest {
+            put("project_id", "project1")
+            putJsonArray("post_ids") {
+                add("post1")
+                add("post2")
+            }
+        }
+
+        // when
+        val handler = getProjectPostsBatchHandler(mockDoorayClient)
+        val result = handler(mockRequest)
+
+        // then
+        val lines = ((result.content.first() as TextContent).text ?: "").trimEnd().lines()
+        assertEquals(3, lines.size)
+        assertContains(lines[0], "\"failedCount\":1")
+        assertContains(lines[1], "\"postId\":\"post1\"")
+        assertContains(lines[1], "TEST-1")
+        assertContains(lines[2], "\"postId\":\"post2\"")
+        assertContains(lines[2], "not found")
+    }
+
+    @Test
+    @DisplayName("업무 여러 건 동시 조회 도구 - 동시에 들어온 호출들도 동시 요청 제한을 함께 지킴")
+    fun testGetProjectPostsBatchHandlerSharesConcurrencyLimit() = runTest {
+        // given
+        val mockDoorayClient = mockk<DoorayClient>()
+        var inFlight = 0
+        var maxInFlight = 0
+
+        coEvery { mockDoorayClient.getPost(any(), any()) } coAnswers
+                {
+                    inFlight++
+                    maxInFlight = maxOf(maxInFlight, inFlight)
+                    delay(100)
+                    inFlight--
+                    PostDetailResponse(header = successHeader, result = samplePost)
+                }
+
+        val mockRequest = toolRequest {
+            put("project_id", "project1")
+            putJsonArray("post_ids") { repeat(10) { add("post$it") } }
+        }
+
+        // when: 두 호출이 각각 10건씩 동시에 조회
+        val handler = getProjectPostsBatchHandler(mockDoorayClient)
+        val first = async { handler(mockRequest) }
+        val second = async { handler(mockRequest) }
+        first.await()
+        second.await()
+
+        // then: 호출마다가 아니라 합쳐서 최대 10건만 동시에 요청
+        coVerify(exactly = 20) { mockDoorayClient.getPost(any(), any()) }
+        assertEquals(10, maxInFlight)
+    }
+
+    @ParameterizedTest(name = "post_ids {0}개 -> {1} / {2}")
+    @CsvSource("0, PARAMETER_MISSING, MISSING_POST_IDS", "51, VALIDATION_ERROR, TOO_MANY_POST_IDS")
+    @DisplayName("업무 여러 건 동시 조회 도구 - post_ids 개수 검증")
+    fun testGetProjectPostsBatchHandlerInvalidSize(
+        size: Int,
+        expectedType: String,
+        expectedCode: String
+    ) = runTest {
+        // given
+        val mockDoorayClient = mockk<DoorayClient>()
+        val mockRequest = toolRequest {
+            put("project_id", "project1")
+            putJsonArray("post_ids") { repeat(size) { add("post$it") } }
+        }
+
+        // when
+        val handler = getProjectPostsBatchHandler(mockDoorayClient)
+        val result = handler(mockRequest)
+
+        // then: 검증 단계에서 거절되므로 API 는 호출되지 않음
+        assertEquals(true, result.isError)
+        val responseText = (result.content.first() as TextContent).text ?: ""
+        assertContains(responseText, "\"type\":\"$expectedType\"")
+        assertContains(responseText, "\"code\":\"$expectedCode\"")
+        coVerify(exactly = 0) { mockDoorayClient.getPost(any(), any()) }
+    }
+
+    /** 주어진 인자로 도구 호출 요청을 만듭니다. 핸들러는 arguments 만 읽으므로 mock 대신 실제 요청 객체를 사용합니다. */
+    private fun toolRequest(arguments: JsonObjectBuilder.() -> Unit = {}): CallToolRequest {
+        return CallToolRequest(name = "test_tool", arguments = buildJsonObject(arguments))
+    }
 }
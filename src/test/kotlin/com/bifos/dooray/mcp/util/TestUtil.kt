@@ -1,9 +1,28 @@
 package com.bifos.dooray.mcp.util
 
+import com.bifos.dooray.mcp.constants.EnvVariableConst
 import java.io.File
 
-fun parseEnv(): Map<String, String> {
+/** 테스트가 사용하는 환경변수 목록 */
+private val TEST_ENV_KEYS =
+    listOf(
+        EnvVariableConst.DOORAY_BASE_URL,
+        EnvVariableConst.DOORAY_API_KEY,
+        EnvVariableConst.DOORAY_TEST_PROJECT_ID,
+        EnvVariableConst.DOORAY_TEST_WIKI_ID
+    )
+
+/**
+ * 테스트용 환경변수를 반환합니다. 실제 환경변수(CI secrets 등)가 있으면 .env 파일 값보다 우선합니다.
+ * .env 파일은 테스트 JVM 에서 한 번만 읽고, 이후 호출(테스트 클래스마다의 @BeforeAll 등)은 같은 결과를 공유합니다.
+ */
+fun parseEnv(): Map<String, String> = cachedEnv
+
+private val cachedEnv: Map<String, String> by lazy { loadEnv() }
+
+private fun loadEnv(): Map<String, String> {
     val env = mutableMapOf<String, String>()
+    val systemEnv = TEST_ENV_KEYS.mapNotNull { key -> System.getenv(key)?.let { key to it } }.toMap()
 
     val envFile = File(".env")
     if (envFile.exists()) {
@@ -21,7 +40,7 @@ fun parseEnv(): Map<String, String> {
                 }
             }
         }
-    } else {
+    } else if (systemEnv.isEmpty()) {
         println("⚠️ 환경변수와 .env 파일이 모두 없습니다.")
         println("💡 GitHub Actions에서는 secrets를 설정하고, 로컬에서는 .env 파일을 생성해주세요.")
         println("  .env 파일 예시:")
@@ -30,5 +49,6 @@ fun parseEnv(): Map<String, String> {
         println("  DOORAY_PROJECT_ID=your_project_id_here")
     }
 
-    return env
+    // 이미 설정된 실제 환경변수는 .env 값으로 덮어쓰지 않습니다
+    return env + systemEnv
 }
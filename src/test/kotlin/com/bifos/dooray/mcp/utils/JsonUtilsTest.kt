@@ -0,0 +1,66 @@
+package com.bifos.dooray.mcp.utils
+
+import kotlinx.coroutines.test.runTest
+import kotlinx.serialization.json.JsonNull
+import kotlinx.serialization.json.JsonPrimitive
+import kotlinx.serialization.json.add
+import kotlinx.serialization.json.addJsonObject
+import kotlinx.serialization.json.buildJsonArray
+import org.junit.jupiter.api.DisplayName
+import org.junit.jupiter.api.Test
+import kotlin.test.assertEquals
+
+class JsonUtilsTest {
+
+    @Test
+    @DisplayName("JSON 배열 인자를 문자열 리스트로 변환")
+    fun testToStringList() {
+        val element = buildJsonArray {
+            add("member1")
+            add("member2")
+        }
+
+        assertEquals(listOf("member1", "member2"), JsonUtils.toStringList(element))
+    }
+
+    @Test
+    @DisplayName("배열이 아니거나 문자열이 아닌 원소가 있으면 빈 리스트")
+    fun testToStringListInvalidInput() {
+        assertEquals(emptyList(), JsonUtils.toStringList(JsonPrimitive("member1")))
+        assertEquals(
+            emptyList(),
+            JsonUtils.toStringList(buildJsonArray { addJsonObject {} })
+        )
+    }
+
+    @Test
+    @DisplayName("숫자나 null 원소가 있으면 문자열로 바꾸지 않고 빈 리스트")
+    fun testToStringListRejectsNonStringPrimitives() {
+        assertEquals(
+            emptyList(),
+            JsonUtils.toStringList(buildJsonArray {
+                add("member1")
+                add(123)
+            })
+        )
+        assertEquals(
+            emptyList(),
+            JsonUtils.toStringList(buildJsonArray {
+                add("member1")
+                add(JsonNull)
+            })
+        )
+    }
+
+    @Test
+    @DisplayName("큰 목록을 다른 디스패처에서 직렬화해도 결과는 동일")
+    fun testToJsonLinesAsyncMatchesToJsonLines() = runTest {
+        val items = (1..250).map { "item$it" }
+
+        val expected = JsonUtils.toJsonLines(mapOf("totalCount" to items.size), items)
+        val actual = JsonUtils.toJsonLinesAsync(mapOf("totalCount" to items.size), items)
+
+        assertEquals(expected, actual)
+        assertEquals(251, actual.trimEnd().lines().size)
+    }
+}
@@ -0,0 +1,68 @@
+package com.bifos.dooray.mcp.utils
+
+import kotlinx.coroutines.CompletableDeferred
+import kotlinx.coroutines.async
+import kotlinx.coroutines.awaitCancellation
+import kotlinx.coroutines.test.runTest
+import kotlinx.coroutines.yield
+import org.junit.jupiter.api.DisplayName
+import org.junit.jupiter.api.Test
+import kotlin.test.assertEquals
+
+class SingleFlightTest {
+
+    @Test
+    @DisplayName("같은 키의 동시 호출은 한 번만 실행하고 결과를 공유")
+    fun testConcurrentCallsShareOneExecution() = runTest {
+        val singleFlight = SingleFlight<String, Int>()
+        val gate = CompletableDeferred<Unit>()
+        var executions = 0
+
+        val first = async {
+            singleFlight.execute("key") {
+                executions++
+                gate.await()
+                42
+            }
+        }
+        val second = async {
+            singleFlight.execute("key") {
+                executions++
+                0
+            }
+        }
+
+        yield() // 두 호출 모두 시작되어 첫 번째 호출의 결과를 기다리는 상태
+        gate.complete(Unit)
+
+        assertEquals(42, first.await())
+        assertEquals(42, second.await())
+        assertEquals(1, executions)
+    }
+
+    @Test
+    @DisplayName("실행이 끝나면 같은 키로 다시 실행")
+    fun testCompletedCallIsNotReused() = runTest {
+        val singleFlight = SingleFlight<String, Int>()
+        var executions = 0
+
+        singleFlight.execute("key") { ++executions }
+        val second = singleFlight.execute("key") { ++executions }
+
+        assertEquals(2, second)
+    }
+
+    @Test
+    @DisplayName("먼저 시작한 호출이 취소되어도 기다리던 호출은 다시 실행하여 결과를 받음")
+    fun testFollowerRetriesWhenLeaderIsCancelled() = runTest {
+        val singleFlight = SingleFlight<String, Int>()
+
+        val leader = async { singleFlight.execute("key") { awaitCancellation() } }
+        val follower = async { singleFlight.execute("key") { 7 } }
+
+        yield() // 두 번째 호출이 첫 번째 호출의 결과를 기다리는 상태
+        leader.cancel()
+
+        assertEquals(7, follower.await())
+    }
+}
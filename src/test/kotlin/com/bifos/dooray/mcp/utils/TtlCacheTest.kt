@@ -0,0 +1,56 @@
+package com.bifos.dooray.mcp.utils
+
+import org.junit.jupiter.api.DisplayName
+import org.junit.jupiter.api.Test
+import kotlin.test.assertEquals
+import kotlin.test.assertNull
+import kotlin.time.Duration.Companion.seconds
+
+class TtlCacheTest {
+
+    private var now = 0L
+
+    @Test
+    @DisplayName("TTL 이 지난 항목은 조회되지 않음")
+    fun testExpiredEntryIsEvicted() {
+        val cache = TtlCache<String, String>(maxSize = 10, ttl = 60.seconds, clock = { now })
+
+        cache.put("key", "value")
+        now += 59.seconds.inWholeNanoseconds
+        assertEquals("value", cache.get("key"))
+
+        now += 1.seconds.inWholeNanoseconds
+        assertNull(cache.get("key"))
+        assertEquals(0, cache.size)
+    }
+
+    @Test
+    @DisplayName("size 는 아직 제거되지 않은 만료 항목을 세지 않음")
+    fun testSizeCountsOnlyLiveEntries() {
+        val cache = TtlCache<String, String>(maxSize = 10, ttl = 60.seconds, clock = { now })
+
+        cache.put("old", "1")
+        now += 30.seconds.inWholeNanoseconds
+        cache.put("new", "2")
+        now += 30.seconds.inWholeNanoseconds
+
+        // "old" 는 만료되었지만 조회된 적이 없어 아직 남아 있음
+        assertEquals(1, cache.size)
+        assertEquals("2", cache.get("new"))
+    }
+
+    @Test
+    @DisplayName("최대 크기를 넘으면 가장 오래 사용되지 않은 항목부터 제거")
+    fun testLeastRecentlyUsedEntryIsEvicted() {
+        val cache = TtlCache<String, String>(maxSize = 2, ttl = 60.seconds, clock = { now })
+
+        cache.put("a", "1")
+        cache.put("b", "2")
+        cache.get("a") // a 를 최근 사용으로 갱신
+        cache.put("c", "3")
+
+        assertEquals("1", cache.get("a"))
+        assertNull(cache.get("b"))
+        assertEquals("3", cache.get("c"))
+    }
+}